@@ -3,6 +3,7 @@ ClerkFactory: Instantiate clerks from archetypes with locked habits.
 """
 
 import random
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -37,6 +38,9 @@ CLERK_LAST_NAMES = [
 
 CLERK_RANKS = ["Spec-1", "Spec-2", "Tech-1", "Tech-2", "Cmdr", "Lt"]
 
+# Prefer libyaml's C loader when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ClerkFactory:
     """Factory for creating clerk instances from archetypes."""
@@ -57,11 +61,12 @@ class ClerkFactory:
     def load_archetypes(self, style_spec_path: Path) -> None:
         """Load clerk archetypes from the style spec YAML."""
         with open(style_spec_path, "r") as f:
-            spec = yaml.safe_load(f)
+            spec = yaml.load(f, Loader=YAML_LOADER)
 
         clerk_archetypes = spec.get("clerk_archetypes", {})
 
         for archetype_id, arch_data in clerk_archetypes.items():
+            archetype_id = sys.intern(archetype_id)
             archetype = self._parse_archetype(archetype_id, arch_data)
             self.archetypes[archetype_id] = archetype
 
@@ -4,7 +4,7 @@ HierarchyLoader: Load and query Terraform Combine hierarchy data.
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from .models import Branch, CollisionSeverity
 
@@ -21,6 +21,7 @@ class HierarchyLoader:
         self.branches: Dict[str, Dict[str, Any]] = {}
         self.collision_index: Dict[str, Dict[str, List[str]]] = {}
         self.structural_signals: Dict[str, Any] = {}
+        self._designator_collisions: Dict[str, Tuple[Tuple[str, str], ...]] = {}
 
         if config_path:
             self.load_config(config_path)
@@ -33,6 +34,7 @@ class HierarchyLoader:
         self.branches = self.config.get("branches", {})
         self.collision_index = self.config.get("collision_index", {})
         self.structural_signals = self.config.get("structural_signals", {})
+        self._designator_collisions = {}
 
     def get_branch_depth(self, branch: Branch) -> int:
         """Return depth for a branch (3, 4, or 5)."""
@@ -96,8 +98,7 @@ class HierarchyLoader:
         colliding_paths: List[str] = []
         for level, designator in post_levels.items():
             matches = self._get_collisions_for_designator(designator)
-            for match in matches:
-                match_branch, match_level = self._split_collision_entry(match)
+            for match_branch, match_level in matches:
                 if match_branch == branch.value and match_level == level:
                     continue
                 colliding_paths.append(f"{match_branch}.{match_level}:{designator}")
@@ -111,22 +112,28 @@ class HierarchyLoader:
             if b == branch.value
         ]
 
-    def _get_collisions_for_designator(self, designator: str) -> List[str]:
-        """Return collision index entries for a designator."""
+    def _get_collisions_for_designator(self, designator: str) -> Tuple[Tuple[str, str], ...]:
+        """Return collision index entries for a designator as (branch, level) pairs."""
+        cached = self._designator_collisions.get(designator)
+        if cached is not None:
+            return cached
+
+        entries: Tuple[Tuple[str, str], ...] = ()
         for section in ("numbers", "letters", "names"):
             matches = self.collision_index.get(section, {}).get(designator)
             if matches:
-                return list(matches)
-        return []
+                entries = tuple(self._split_collision_entry(match) for match in matches)
+                break
+        self._designator_collisions[designator] = entries
+        return entries
 
     def _has_cross_branch_collision(
         self,
         branch: Branch,
-        matches: List[str],
+        matches: Tuple[Tuple[str, str], ...],
     ) -> bool:
         """Check if collision entries include a different branch."""
-        for match in matches:
-            match_branch, _ = self._split_collision_entry(match)
+        for match_branch, _ in matches:
             if match_branch and match_branch != branch.value:
                 return True
         return False
@@ -197,7 +197,7 @@ class Situation:
     vocabulary_pool: VocabularyPool = field(default_factory=VocabularyPool)
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     """
     A single state in a soldier's service.
@@ -216,7 +216,7 @@ class State:
     colliding_paths: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Soldier:
     """A soldier with 1-3 states."""
     soldier_id: str
@@ -230,7 +230,7 @@ class Soldier:
     structural_resolvability: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Entry:
     """A single rendered record."""
     entry_id: str
@@ -246,7 +246,7 @@ class Entry:
     extraction_signals: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     """A source document (manifest page, personnel list, etc.)."""
     source_id: str
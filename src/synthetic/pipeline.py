@@ -3,6 +3,7 @@ Pipeline: Wire all components together for synthetic data generation (v4.1).
 """
 
 import random
+from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
@@ -21,6 +22,9 @@ from .difficulty_computer import DifficultyComputer
 from .difficulty_rebalancer import DifficultyRebalancer
 
 
+TEMPORAL_ANCHORS = (1, 2, 3)
+
+
 class Pipeline:
     """Main pipeline for synthetic data generation."""
 
@@ -74,10 +78,12 @@ class Pipeline:
         self.sources: Dict[str, Source] = {}
         self.entries: Dict[str, Entry] = {}
         self._entry_counter = 0
+        self._home_unit_levels: Dict[Branch, Tuple[str, ...]] = {}
 
-    def _generate_entry_id(self) -> str:
-        self._entry_counter += 1
-        return f"ENT{self._entry_counter:06d}"
+    def _generate_entry_ids(self, count: int) -> List[str]:
+        start = self._entry_counter + 1
+        self._entry_counter += count
+        return [f"ENT{n:06d}" for n in range(start, start + count)]
 
     def generate(
         self,
@@ -95,17 +101,27 @@ class Pipeline:
             s.soldier_id: [] for s in self.soldiers.values()
         }
 
+        all_soldiers = list(self.soldiers.values())
+        soldiers_by_anchor = {
+            anchor: self._group_soldiers_by_branch(all_soldiers, anchor)
+            for anchor in TEMPORAL_ANCHORS
+        }
+        render_entry = self.renderer.render_entry
+        vocabulary_injector = self.vocabulary_injector
+        entries = self.entries
+
         while total_entries < target_records:
             source_size = self._entries_per_source()
             source_size = min(source_size, target_records - total_entries)
             if source_size <= 0:
                 break
 
-            temporal_anchor = self.rng.choice([1, 2, 3])
+            temporal_anchor = self.rng.choice(TEMPORAL_ANCHORS)
             source_soldiers = self._sample_soldiers_for_source(
-                list(self.soldiers.values()),
+                all_soldiers,
                 source_size,
                 temporal_anchor,
+                soldiers_by_anchor[temporal_anchor],
             )
             if not source_soldiers:
                 break
@@ -129,20 +145,20 @@ class Pipeline:
             if not clerk or not situation:
                 continue
 
-            for soldier, state in zip(source_soldiers, states_for_source):
-                entry_id = self._generate_entry_id()
-                entry = self.renderer.render_entry(
+            entry_ids = self._generate_entry_ids(len(source_soldiers))
+            for entry_id, soldier, state in zip(entry_ids, source_soldiers, states_for_source):
+                entry = render_entry(
                     entry_id=entry_id,
                     soldier=soldier,
                     state=state,
                     source=source,
                     clerk=clerk,
                     situation=situation,
-                    vocabulary_injector=self.vocabulary_injector,
+                    vocabulary_injector=vocabulary_injector,
                 )
-                self.entries[entry.entry_id] = entry
+                entries[entry_id] = entry
                 entries_by_soldier[soldier.soldier_id].append(entry)
-                clerk.entry_count += 1
+            clerk.entry_count += len(entry_ids)
 
             total_entries += source_size
 
@@ -150,8 +166,8 @@ class Pipeline:
             soldier_entries = entries_by_soldier.get(soldier.soldier_id, [])
             self.difficulty_computer.compute_difficulty(soldier, soldier_entries)
 
-        if self.rebalancer.needs_rebalancing(list(self.soldiers.values())):
-            self.rebalancer.identify_adjustments(list(self.soldiers.values()))
+        if self.rebalancer.needs_rebalancing(all_soldiers):
+            self.rebalancer.identify_adjustments(all_soldiers)
 
         raw_records = self._build_raw_records()
         validation_records = self._build_validation_records()
@@ -169,8 +185,8 @@ class Pipeline:
 
     def _generate_soldiers(self, count: int) -> None:
         """Generate soldiers across branches."""
-        for i in range(count):
-            soldier = self.soldier_factory.create_soldier(f"S{i:04d}")
+        soldier_ids = [f"S{i:04d}" for i in range(count)]
+        for soldier in self.soldier_factory.create_soldiers(soldier_ids):
             self.soldiers[soldier.soldier_id] = soldier
 
     def _entries_per_source(self) -> int:
@@ -183,6 +199,7 @@ class Pipeline:
         soldiers: List[Soldier],
         count: int,
         temporal_anchor: int,
+        soldiers_by_branch: Optional[Dict[Branch, List[Soldier]]] = None,
     ) -> List[Soldier]:
         """Sample soldiers with unit concentration by Level-3."""
         if not soldiers:
@@ -193,26 +210,47 @@ class Pipeline:
         primary_state = self._select_state_for_source(primary, temporal_anchor)
         primary_branch = primary_state.branch
 
-        same_branch = [
-            s for s in soldiers
-            if self._select_state_for_source(s, temporal_anchor).branch == primary_branch
-        ]
+        if soldiers_by_branch is None:
+            soldiers_by_branch = self._group_soldiers_by_branch(soldiers, temporal_anchor)
+        same_branch = soldiers_by_branch.get(primary_branch, [])
 
         result: List[Soldier] = [primary]
         chosen = {primary.soldier_id}
         while len(result) < count:
             pool = same_branch if self.rng.random() < 0.70 and same_branch else soldiers
-            candidates = [s for s in pool if s.soldier_id not in chosen]
-            if not candidates:
-                candidates = [s for s in soldiers if s.soldier_id not in chosen]
-            if not candidates:
+            pick = self._pick_unchosen(pool, chosen)
+            if pick is None:
+                pick = self._pick_unchosen(soldiers, chosen)
+            if pick is None:
                 break
-            pick = self.rng.choice(candidates)
             result.append(pick)
             chosen.add(pick.soldier_id)
 
         return result
 
+    def _group_soldiers_by_branch(
+        self,
+        soldiers: List[Soldier],
+        temporal_anchor: int,
+    ) -> Dict[Branch, List[Soldier]]:
+        """Group soldiers by the branch of the state a source at this anchor captures."""
+        by_branch: Dict[Branch, List[Soldier]] = defaultdict(list)
+        for soldier in soldiers:
+            branch = self._select_state_for_source(soldier, temporal_anchor).branch
+            by_branch[branch].append(soldier)
+        return dict(by_branch)
+
+    def _pick_unchosen(self, pool: List[Soldier], chosen: set) -> Optional[Soldier]:
+        """Pick a soldier not yet chosen, copying the pool only when retries fail."""
+        for _ in range(8):
+            pick = self.rng.choice(pool)
+            if pick.soldier_id not in chosen:
+                return pick
+        candidates = [s for s in pool if s.soldier_id not in chosen]
+        if not candidates:
+            return None
+        return self.rng.choice(candidates)
+
     def _select_state_for_source(self, soldier: Soldier, temporal_anchor: int):
         """Select which state a source captures for a soldier."""
         if temporal_anchor <= len(soldier.states):
@@ -221,17 +259,16 @@ class Pipeline:
 
     def _determine_home_unit(self, states) -> str:
         """Determine the home unit for a source based on majority Level-3."""
-        counts: Dict[str, int] = {}
-        for state in states:
-            home_unit = self._build_home_unit(state)
-            counts[home_unit] = counts.get(home_unit, 0) + 1
+        counts = Counter(self._build_home_unit(state) for state in states)
         return max(counts, key=counts.get)
 
     def _build_home_unit(self, state) -> str:
         """Build a branch-prefixed Level-3 home unit string."""
-        levels = self.hierarchy_loader.get_branch_levels(state.branch)
-        level3 = levels[:3]
-        path = "/".join(state.post_levels.get(lvl, "") for lvl in level3)
+        level3 = self._home_unit_levels.get(state.branch)
+        if level3 is None:
+            level3 = tuple(self.hierarchy_loader.get_branch_levels(state.branch)[:3])
+            self._home_unit_levels[state.branch] = level3
+        path = "/".join([state.post_levels.get(lvl, "") for lvl in level3])
         return f"{state.branch.value}:{path}"
 
     def _branch_from_home_unit(self, home_unit: str) -> Optional[Branch]:
@@ -245,49 +282,48 @@ class Pipeline:
 
     def _build_raw_records(self) -> List[Dict[str, Any]]:
         """Build raw records for export."""
-        records = []
-        for entry in self.entries.values():
-            records.append({
+        return [
+            {
                 "source_id": entry.source_id,
                 "soldier_id": entry.soldier_id,
                 "raw_text": entry.raw_text,
-            })
-        return records
+            }
+            for entry in self.entries.values()
+        ]
 
     def _build_validation_records(self) -> List[Dict[str, Any]]:
         """Build validation records for export."""
-        records = []
-        for soldier in self.soldiers.values():
-            for state in soldier.states:
-                records.append({
-                    "soldier_id": soldier.soldier_id,
-                    "state_id": state.state_id,
-                    "state_order": state.state_order,
-                    "branch": state.branch.value,
-                    "post_path": state.post_path,
-                    **state.post_levels,
-                })
-        return records
+        return [
+            {
+                "soldier_id": soldier.soldier_id,
+                "state_id": state.state_id,
+                "state_order": state.state_order,
+                "branch": state.branch.value,
+                "post_path": state.post_path,
+                **state.post_levels,
+            }
+            for soldier in self.soldiers.values()
+            for state in soldier.states
+        ]
 
     def _build_source_records(self) -> List[Dict[str, Any]]:
         """Build sources records for export."""
-        records = []
-        for source in self.sources.values():
-            records.append({
+        return [
+            {
                 "source_id": source.source_id,
                 "clerk_id": source.clerk_id,
                 "situation_id": source.situation_id,
                 "quality_tier": source.quality_tier,
                 "home_unit": source.home_unit,
                 "temporal_anchor": source.temporal_anchor,
-            })
-        return records
+            }
+            for source in self.sources.values()
+        ]
 
     def _build_synthetic_records(self) -> List[Dict[str, Any]]:
         """Build per-record synthetic metadata for export."""
-        records = []
-        for entry in self.entries.values():
-            records.append({
+        return [
+            {
                 "source_id": entry.source_id,
                 "soldier_id": entry.soldier_id,
                 "state_id": entry.state_id,
@@ -297,14 +333,14 @@ class Pipeline:
                 "path_completeness": entry.path_completeness,
                 "levels_provided": entry.levels_provided,
                 "extraction_signals": entry.extraction_signals,
-            })
-        return records
+            }
+            for entry in self.entries.values()
+        ]
 
     def _build_synthetic_soldiers(self) -> List[Dict[str, Any]]:
         """Build per-soldier synthetic generation metrics for export."""
-        records = []
-        for soldier in self.soldiers.values():
-            records.append({
+        return [
+            {
                 "soldier_id": soldier.soldier_id,
                 "gen_difficulty_tier": (
                     soldier.difficulty_tier.value
@@ -314,8 +350,9 @@ class Pipeline:
                 "gen_complementarity_score": soldier.complementarity_score,
                 "gen_structural_resolvability": soldier.structural_resolvability,
                 "target_state_count": len(soldier.states),
-            })
-        return records
+            }
+            for soldier in self.soldiers.values()
+        ]
 
     def export_parquet(
         self,
@@ -398,22 +435,16 @@ class Pipeline:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive pipeline statistics."""
-        entries_per_source: Dict[str, int] = {}
-        for entry in self.entries.values():
-            entries_per_source[entry.source_id] = entries_per_source.get(entry.source_id, 0) + 1
-
-        difficulty_counts: Dict[str, int] = {}
-        for soldier in self.soldiers.values():
-            tier = soldier.difficulty_tier.value if soldier.difficulty_tier else "unknown"
-            difficulty_counts[tier] = difficulty_counts.get(tier, 0) + 1
+        difficulty_counts = Counter(
+            soldier.difficulty_tier.value if soldier.difficulty_tier else "unknown"
+            for soldier in self.soldiers.values()
+        )
 
         return {
             "total_soldiers": len(self.soldiers),
             "total_sources": len(self.sources),
             "total_entries": len(self.entries),
-            "avg_entries_per_source": (
-                sum(entries_per_source.values()) / max(len(self.sources), 1)
-            ),
+            "avg_entries_per_source": len(self.entries) / max(len(self.sources), 1),
             "difficulty_distribution": {
                 k: v / max(len(self.soldiers), 1)
                 for k, v in difficulty_counts.items()
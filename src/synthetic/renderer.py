@@ -2,8 +2,11 @@
 Renderer: Render soldier states to raw text using clerk formats.
 """
 
+import bisect
 import random
-from typing import Dict, List, Optional, Tuple
+import re
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from .hierarchy_loader import HierarchyLoader
 from .models import (
@@ -78,6 +81,26 @@ LEVEL_LABELS_MICRO = {
     "crew": "Cr",
 }
 
+LEVEL_LABELS_BY_STYLE = {
+    "micro": LEVEL_LABELS_MICRO,
+    "full": LEVEL_LABELS,
+}
+
+
+def _build_label_variants() -> Dict[str, Set[str]]:
+    """Collect every label spelling for each level across label styles."""
+    variants: Dict[str, Set[str]] = {}
+    for labels in (LEVEL_LABELS, LEVEL_LABELS_ABBREV, LEVEL_LABELS_MICRO):
+        for level, label in labels.items():
+            variants.setdefault(level, set()).add(label)
+    return variants
+
+
+LEVEL_LABEL_VARIANTS = _build_label_variants()
+
+# Name template placeholders; any other text in a template is kept as-is
+NAME_PLACEHOLDER_PATTERN = re.compile(r"\{(LAST|FIRST|FI|MI)\}")
+
 GREEK_LETTERS = {
     "Alpha",
     "Beta",
@@ -115,12 +138,32 @@ FAMILIARITY_LABEL_OMISSION_BOOST = {
     FamiliarityLevel.DIFFERENT_BRANCH: 0.0,
 }
 
+TYPO_OPS = ("transpose", "substitute", "omit", "double")
+
+ABBREVIATION_LENGTHS = (2, 3, 4)
+
+UNIT_COMPONENT_SEPARATORS = ("/", ",", ";")
+
+TYPO_SUBSTITUTIONS = {
+    "l": "1",
+    "O": "0",
+    "rn": "m",
+    "m": "rn",
+    "S": "5",
+    "E": "F",
+}
+
+
 class Renderer:
     """Renders soldier states to raw text using clerk formats."""
 
     def __init__(self, hierarchy_loader: HierarchyLoader, random_seed: Optional[int] = None):
         self.rng = random.Random(random_seed)
         self.hierarchy = hierarchy_loader
+        self._branch_levels: Dict[Branch, Tuple[str, ...]] = {}
+        self._branch_signal_terms: Dict[Branch, Tuple[Tuple[str, str], ...]] = {}
+        self._level_drop_weights: Dict[Tuple[str, ...], Dict[str, int]] = {}
+        self._home_units: Dict[str, Tuple[Optional[str], Dict[str, str]]] = {}
 
     def render_entry(
         self,
@@ -175,15 +218,13 @@ class Renderer:
             mi = ""
             middle = ""
 
-        result = template
-        result = result.replace("{LAST}", last)
-        result = result.replace("{FIRST}", first)
-        result = result.replace("{FI}", fi)
-        result = result.replace("{MI}", mi)
+        fields = {"LAST": last, "FIRST": first, "FI": fi, "MI": mi}
+        result = NAME_PLACEHOLDER_PATTERN.sub(lambda match: fields[match.group(1)], template)
 
-        result = result.replace(" .", "")
-        result = result.replace(".,", ",")
-        result = result.replace(". ", " ")
+        if "." in result:
+            result = result.replace(" .", "")
+            result = result.replace(".,", ",")
+            result = result.replace(". ", " ")
         result = result.replace("  ", " ")
 
         return result.strip()
@@ -204,7 +245,7 @@ class Renderer:
 
     def render_unit(self, state: State, source, clerk: Clerk) -> Tuple[str, List[str]]:
         """Render a unit string and return provided levels."""
-        levels = self.hierarchy.get_branch_levels(state.branch)
+        levels = self._get_branch_levels(state.branch)
         familiarity = self._get_familiarity_level(source, state, clerk)
 
         include_levels = self._select_levels(levels, familiarity, clerk)
@@ -219,6 +260,14 @@ class Renderer:
 
         return unit_text, levels_provided
 
+    def _get_branch_levels(self, branch: Branch) -> Tuple[str, ...]:
+        """Return ordered level names for a branch, cached per renderer."""
+        levels = self._branch_levels.get(branch)
+        if levels is None:
+            levels = tuple(self.hierarchy.get_branch_levels(branch))
+            self._branch_levels[branch] = levels
+        return levels
+
     def _get_familiarity_level(self, source, state: State, clerk: Clerk) -> FamiliarityLevel:
         """Determine familiarity level relative to the source home unit."""
         if clerk.familiarity_override == "ignore" or not clerk.familiarity_applies:
@@ -228,7 +277,7 @@ class Renderer:
         if not home_branch or home_branch != state.branch.value:
             return FamiliarityLevel.DIFFERENT_BRANCH
 
-        branch_levels = self.hierarchy.get_branch_levels(state.branch)
+        branch_levels = self._get_branch_levels(state.branch)
         if len(branch_levels) < 3:
             return FamiliarityLevel.SAME_BRANCH
 
@@ -251,6 +300,14 @@ class Renderer:
         return FamiliarityLevel.SAME_BRANCH
 
     def _parse_home_unit(self, home_unit: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """Parse a home_unit string into branch and level mapping, cached per home unit."""
+        parsed = self._home_units.get(home_unit)
+        if parsed is None:
+            parsed = self._parse_home_unit_uncached(home_unit)
+            self._home_units[home_unit] = parsed
+        return parsed
+
+    def _parse_home_unit_uncached(self, home_unit: str) -> Tuple[Optional[str], Dict[str, str]]:
         """Parse a home_unit string into branch and level mapping."""
         if ":" not in home_unit:
             return None, {}
@@ -262,7 +319,7 @@ class Renderer:
             branch_enum = Branch(branch)
         except ValueError:
             return branch, {}
-        level_names = self.hierarchy.get_branch_levels(branch_enum)
+        level_names = self._get_branch_levels(branch_enum)
         mapping: Dict[str, str] = {}
         for name, value in zip(level_names, levels):
             mapping[name] = value
@@ -291,7 +348,8 @@ class Renderer:
         if not clerk.unit_format.include_level2 and len(levels) > 1:
             include = [lvl for lvl in include if lvl != levels[1]]
         if not clerk.unit_format.include_lowest_levels and len(levels) > 3:
-            include = [lvl for lvl in include if levels.index(lvl) <= 2]
+            top_levels = levels[:3]
+            include = [lvl for lvl in include if lvl in top_levels]
 
         if not include and levels:
             include = [levels[-1]]
@@ -329,29 +387,33 @@ class Renderer:
         if len(remaining) <= target_count:
             return remaining
 
+        level_weights = self._get_level_drop_weights(all_levels)
+        weights = [level_weights[level] for level in remaining]
         while len(remaining) > target_count and len(remaining) > 1:
-            weights = []
-            for level in remaining:
-                idx = all_levels.index(level)
-                weight = max(len(all_levels) - idx, 1)
-                weights.append(weight * weight)
             drop_index = self._weighted_choice_index(weights)
             remaining.pop(drop_index)
+            weights.pop(drop_index)
 
         return remaining
 
+    def _get_level_drop_weights(self, all_levels: Sequence[str]) -> Dict[str, int]:
+        """Return drop weights favouring higher echelons, cached per level tuple."""
+        key = tuple(all_levels)
+        weights = self._level_drop_weights.get(key)
+        if weights is None:
+            depth = len(key)
+            weights = {level: max(depth - index, 1) ** 2 for index, level in enumerate(key)}
+            self._level_drop_weights[key] = weights
+        return weights
+
     def _weighted_choice_index(self, weights: List[int]) -> int:
         """Select an index using integer weights."""
-        total = sum(weights)
+        cum_weights = list(accumulate(weights))
+        total = cum_weights[-1] if cum_weights else 0
         if total <= 0:
             return 0
         roll = self.rng.uniform(0, total)
-        upto = 0.0
-        for idx, weight in enumerate(weights):
-            upto += weight
-            if roll <= upto:
-                return idx
-        return len(weights) - 1
+        return min(bisect.bisect_left(cum_weights, roll), len(weights) - 1)
 
     def _format_unit(
         self,
@@ -453,11 +515,11 @@ class Renderer:
 
     def _level_label(self, level: str, clerk: Clerk, micro: bool) -> str:
         """Resolve level label based on style."""
-        if micro or clerk.unit_format.label_style == "micro":
-            return LEVEL_LABELS_MICRO.get(level, level.title())
-        if clerk.unit_format.label_style == "full":
-            return LEVEL_LABELS.get(level, level.title())
-        return LEVEL_LABELS_ABBREV.get(level, level.title())
+        style = "micro" if micro else clerk.unit_format.label_style
+        label = LEVEL_LABELS_BY_STYLE.get(style, LEVEL_LABELS_ABBREV).get(level)
+        if label is None:
+            return level.title()
+        return label
 
     def _phoneticize(self, value: str) -> str:
         """Expand letters into phonetic words when possible."""
@@ -478,7 +540,7 @@ class Renderer:
         if len(value) <= 4:
             return value[:2]
 
-        abbrev_len = self.rng.choice([2, 3, 4])
+        abbrev_len = self.rng.choice(ABBREVIATION_LENGTHS)
         if self.rng.random() < 0.5:
             return value[:abbrev_len]
 
@@ -534,9 +596,17 @@ class Renderer:
         """Extract structural signals from rendered unit string."""
         signals: List[str] = []
 
-        unique_terms = self.hierarchy.get_structural_signals_for_branch(state.branch)
-        for term in unique_terms:
-            if term.lower() in unit_string.lower():
+        signal_terms = self._branch_signal_terms.get(state.branch)
+        if signal_terms is None:
+            signal_terms = tuple(
+                (term, term.lower())
+                for term in self.hierarchy.get_structural_signals_for_branch(state.branch)
+            )
+            self._branch_signal_terms[state.branch] = signal_terms
+
+        unit_lower = unit_string.lower()
+        for term, term_lower in signal_terms:
+            if term_lower in unit_lower:
                 signals.append(f"branch_unique:{term}")
 
         if len(levels_provided) >= 4:
@@ -551,41 +621,38 @@ class Renderer:
         result = text
         imp = clerk.imperfections
 
-        if self.rng.random() < imp.trailing_off and len(result) > 2:
+        if imp.trailing_off > 0 and self.rng.random() < imp.trailing_off and len(result) > 2:
             cut_point = self.rng.randint(len(result) // 2, len(result) - 1)
             result = result[:cut_point]
 
-        if unit_text and self.rng.random() < imp.abbreviation_inconsistency:
+        if (
+            unit_text
+            and imp.abbreviation_inconsistency > 0
+            and self.rng.random() < imp.abbreviation_inconsistency
+        ):
             altered_unit = self._apply_abbreviation_inconsistency(unit_text)
             if altered_unit != unit_text and unit_text in result:
                 result = result.replace(unit_text, altered_unit, 1)
 
-        if self.rng.random() < imp.typo_rate:
+        if imp.typo_rate > 0 and self.rng.random() < imp.typo_rate:
             result = self._inject_typo(result)
 
-        if self.rng.random() < imp.mid_entry_corrections:
+        if imp.mid_entry_corrections > 0 and self.rng.random() < imp.mid_entry_corrections:
             result = self._apply_mid_entry_correction(result)
 
-        if unit_text and self.rng.random() < imp.incomplete_unit:
+        if unit_text and imp.incomplete_unit > 0 and self.rng.random() < imp.incomplete_unit:
             altered_unit = self._drop_unit_component(unit_text)
             if altered_unit != unit_text and unit_text in result:
                 result = result.replace(unit_text, altered_unit, 1)
 
-        if self.rng.random() < imp.column_bleed:
+        if imp.column_bleed > 0 and self.rng.random() < imp.column_bleed:
             result = self._apply_column_bleed(result)
 
         return result
 
     def _apply_abbreviation_inconsistency(self, unit_text: str) -> str:
         """Swap one unit label variant for a mixed abbreviation style."""
-        variants = {}
-        for level, label in LEVEL_LABELS.items():
-            variants.setdefault(level, set()).add(label)
-        for level, label in LEVEL_LABELS_ABBREV.items():
-            variants.setdefault(level, set()).add(label)
-        for level, label in LEVEL_LABELS_MICRO.items():
-            variants.setdefault(level, set()).add(label)
-
+        variants = LEVEL_LABEL_VARIANTS
         matches = []
         for level, labels in variants.items():
             for label in labels:
@@ -609,38 +676,25 @@ class Renderer:
         if not text:
             return text
 
-        ops = ["transpose", "substitute", "omit", "double"]
-        op = self.rng.choice(ops)
+        op = self.rng.choice(TYPO_OPS)
         idx = self.rng.randint(0, max(len(text) - 1, 0))
 
         if op == "transpose" and len(text) > 2 and idx < len(text) - 1:
-            chars = list(text)
-            chars[idx], chars[idx + 1] = chars[idx + 1], chars[idx]
-            return "".join(chars)
+            return f"{text[:idx]}{text[idx + 1]}{text[idx]}{text[idx + 2:]}"
 
         if op == "omit" and len(text) > 1:
-            return text[:idx] + text[idx + 1:]
-
-        substitutions = {
-            "l": "1",
-            "O": "0",
-            "rn": "m",
-            "m": "rn",
-            "S": "5",
-            "E": "F",
-        }
-        for key, value in substitutions.items():
-            if key in text:
-                return text.replace(key, value, 1)
+            return f"{text[:idx]}{text[idx + 1:]}"
 
         if op == "double" and len(text) > 1:
-            return text[:idx] + text[idx] + text[idx:]
+            return f"{text[:idx]}{text[idx]}{text[idx:]}"
 
-        if op == "substitute" and len(text) > 1:
-            alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            if text[idx].isalpha():
-                replacement = self.rng.choice(alphabet)
-                return text[:idx] + replacement + text[idx + 1:]
+        if op == "substitute":
+            for key, value in TYPO_SUBSTITUTIONS.items():
+                if key in text:
+                    return text.replace(key, value, 1)
+            if len(text) > 1 and text[idx].isalpha():
+                replacement = self.rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+                return f"{text[:idx]}{replacement}{text[idx + 1:]}"
 
         return text
 
@@ -654,8 +708,7 @@ class Renderer:
 
     def _drop_unit_component(self, unit_text: str) -> str:
         """Drop a unit component from the unit string."""
-        separators = ["/", ",", ";"]
-        for sep in separators:
+        for sep in UNIT_COMPONENT_SEPARATORS:
             if sep in unit_text:
                 parts = [p.strip() for p in unit_text.split(sep) if p.strip()]
                 if len(parts) > 1:
@@ -673,5 +726,5 @@ class Renderer:
         """Merge delimiters between adjacent fields."""
         for i in range(1, len(text) - 1):
             if text[i] == " " and text[i - 1].isalnum() and text[i + 1].isalnum():
-                return text[:i] + text[i + 1:]
+                return f"{text[:i]}{text[i + 1:]}"
         return text
@@ -2,11 +2,14 @@
 SituationManager: Load and assign situations to sources.
 """
 
+import bisect
 import json
-import random
+from itertools import accumulate
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+import numpy as np
+
 from .models import Situation, VocabularyPool
 
 
@@ -18,12 +21,16 @@ class SituationManager:
         themes_path: Optional[Path] = None,
         vocabulary_path: Optional[Path] = None,
         random_seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
     ):
-        self.rng = random.Random(random_seed)
+        self.rng = rng if rng is not None else np.random.default_rng(random_seed)
         self.situations: Dict[str, Situation] = {}
         self.branch_themes: Dict[str, Dict[str, Any]] = {}
         self.situational_terms: Dict[str, List[str]] = {}
+        self._sorted_term_keys: List[str] = []
         self.assignment_counts: Dict[str, int] = {}
+        self._situations_used = 0
+        self.situations_by_branch: Dict[str, List[str]] = {}
 
         if themes_path:
             self.load_themes(themes_path)
@@ -44,13 +51,19 @@ class SituationManager:
         with open(vocabulary_path, "r") as f:
             data = json.load(f)
         self.situational_terms = data.get("situational", {})
+        self._sorted_term_keys = sorted(self.situational_terms)
 
     def _build_situations(self) -> None:
         """Create Situation objects per theme."""
+        self.situations_by_branch = {}
+        self._situations_used = 0
+        pools_by_pattern: Dict[str, VocabularyPool] = {}
         for branch, theme in self.branch_themes.items():
             vocab_pattern = theme.get("vocabulary_pool", "")
-            vocab_terms = self._resolve_vocabulary(vocab_pattern)
-            pool = VocabularyPool(primary=vocab_terms)
+            pool = pools_by_pattern.get(vocab_pattern)
+            if pool is None:
+                pool = VocabularyPool(primary=self._resolve_vocabulary(vocab_pattern))
+                pools_by_pattern[vocab_pattern] = pool
 
             for situation_id in theme.get("situations", []):
                 situation = Situation(
@@ -62,16 +75,20 @@ class SituationManager:
                 self.situations[situation_id] = situation
                 self.assignment_counts[situation_id] = 0
 
+            self.situations_by_branch[branch] = list(theme.get("situations", []))
+
     def _resolve_vocabulary(self, pattern: str) -> List[str]:
         """Resolve a vocabulary pattern into a list of terms."""
         if not pattern:
             return []
         if pattern.endswith("*"):
             prefix = pattern[:-1]
+            keys = self._sorted_term_keys
             terms: List[str] = []
-            for key, values in self.situational_terms.items():
-                if key.startswith(prefix):
-                    terms.extend(values)
+            for key in keys[bisect.bisect_left(keys, prefix):]:
+                if not key.startswith(prefix):
+                    break
+                terms.extend(self.situational_terms[key])
             return sorted(set(terms))
         return list(self.situational_terms.get(pattern, []))
 
@@ -85,25 +102,27 @@ class SituationManager:
 
     def assign_situation(self, branch: str, bias_recent: bool = True) -> Situation:
         """Assign a situation to a source based on branch compatibility."""
-        theme = self.branch_themes.get(branch, {})
-        candidates = theme.get("situations", [])
+        candidates = self.situations_by_branch.get(branch)
 
         if not candidates:
             raise ValueError(f"No situations available for branch: {branch}")
 
-        if bias_recent and self.assignment_counts:
+        if bias_recent and self._situations_used:
             used = [sid for sid in candidates if self.assignment_counts.get(sid, 0) > 0]
             if used and self.rng.random() < 0.7:
-                weights = [self.assignment_counts[sid] ** 0.5 for sid in used]
-                total = sum(weights)
-                weights = [w / total for w in weights]
-                situation_id = self.rng.choices(used, weights=weights)[0]
+                cum_weights = list(accumulate(self.assignment_counts[sid] ** 0.5 for sid in used))
+                roll = self.rng.random() * cum_weights[-1]
+                index = bisect.bisect_right(cum_weights, roll)
+                situation_id = used[min(index, len(used) - 1)]
             else:
-                situation_id = self.rng.choice(candidates)
+                situation_id = candidates[self.rng.integers(len(candidates))]
         else:
-            situation_id = self.rng.choice(candidates)
+            situation_id = candidates[self.rng.integers(len(candidates))]
 
-        self.assignment_counts[situation_id] = self.assignment_counts.get(situation_id, 0) + 1
+        count = self.assignment_counts.get(situation_id, 0) + 1
+        self.assignment_counts[situation_id] = count
+        if count == 1:
+            self._situations_used += 1
         return self.situations[situation_id]
 
     def get_archetype_pool(self, branch: str) -> List[str]:
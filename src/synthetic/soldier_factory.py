@@ -2,7 +2,9 @@
 SoldierFactory: Generate soldier truth records for Terraform Combine.
 """
 
-from typing import Dict, List, Tuple
+import bisect
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -46,6 +48,23 @@ RANKS = [
     ("Chief", 0.01),
 ]
 
+BRANCHES = tuple(Branch)
+
+TRANSFER_SCOPE_WEIGHTS = (
+    (TransferScope.WITHIN_LEVEL3, 0.20),
+    (TransferScope.WITHIN_LEVEL2, 0.30),
+    (TransferScope.WITHIN_BRANCH, 0.35),
+    (TransferScope.CROSS_BRANCH, 0.15),
+)
+TRANSFER_SCOPES = tuple(scope for scope, _ in TRANSFER_SCOPE_WEIGHTS)
+TRANSFER_SCOPE_CUM_WEIGHTS = np.cumsum([weight for _, weight in TRANSFER_SCOPE_WEIGHTS])
+TRANSFER_SCOPE_CUM_WEIGHTS /= TRANSFER_SCOPE_CUM_WEIGHTS[-1]
+
+STATE_COUNT_WEIGHTS = ((1, 0.65), (2, 0.28), (3, 0.07))
+STATE_COUNTS = tuple(count for count, _ in STATE_COUNT_WEIGHTS)
+STATE_COUNT_CUM_WEIGHTS = np.cumsum([weight for _, weight in STATE_COUNT_WEIGHTS])
+STATE_COUNT_CUM_WEIGHTS /= STATE_COUNT_CUM_WEIGHTS[-1]
+
 
 class SoldierFactory:
     """Factory for generating soldier truth records."""
@@ -57,6 +76,13 @@ class SoldierFactory:
 
         self.rank_names = [r[0] for r in RANKS]
         self.rank_weights = [r[1] for r in RANKS]
+        self._rank_cum_weights = list(accumulate(self.rank_weights))
+        self._rank_cdf = np.array(self._rank_cum_weights) / self._rank_cum_weights[-1]
+
+        self._posts: Dict[
+            Tuple[Branch, Tuple[Tuple[str, str], ...]],
+            Tuple[str, Dict[str, str], CollisionSeverity, Tuple[str, ...]],
+        ] = {}
 
     def create_soldier(self, soldier_id: str) -> Soldier:
         """Create a soldier with 1-3 states."""
@@ -75,6 +101,53 @@ class SoldierFactory:
             states=states,
         )
 
+    def create_soldiers(self, soldier_ids: List[str]) -> List[Soldier]:
+        """Create soldiers in bulk, drawing names, ranks, state counts, and scopes per batch."""
+        n = len(soldier_ids)
+        first_indices = self.rng.integers(len(FIRST_NAMES), size=n).tolist()
+        last_indices = self.rng.integers(len(LAST_NAMES), size=n).tolist()
+        middle_indices = self.rng.integers(len(MIDDLE_INITIALS), size=n).tolist()
+        has_middle = (self.rng.random(n) < 0.70).tolist()
+        rank_indices = self._rank_cdf.searchsorted(self.rng.random(n), side="right").tolist()
+        state_counts = [
+            STATE_COUNTS[i]
+            for i in STATE_COUNT_CUM_WEIGHTS.searchsorted(self.rng.random(n), side="right")
+        ]
+        branch_indices = self.rng.integers(len(BRANCHES), size=n)
+
+        initial_posts: List[Dict[str, str]] = [{} for _ in range(n)]
+        for branch_index, branch in enumerate(BRANCHES):
+            members = np.flatnonzero(branch_indices == branch_index).tolist()
+            for i, post in zip(members, self._generate_posts(branch, len(members))):
+                initial_posts[i] = post
+        branch_indices = branch_indices.tolist()
+        transfer_scopes = self._sample_transfer_scopes(sum(state_counts) - n)
+
+        soldiers: List[Soldier] = []
+        append = soldiers.append
+        generate_states = self._generate_states
+        rank_names = self.rank_names
+        offset = 0
+        for i, soldier_id in enumerate(soldier_ids):
+            state_count = state_counts[i]
+            next_offset = offset + state_count - 1
+            append(Soldier(
+                soldier_id=soldier_id,
+                name_first=FIRST_NAMES[first_indices[i]],
+                name_middle=MIDDLE_INITIALS[middle_indices[i]] if has_middle[i] else "",
+                name_last=LAST_NAMES[last_indices[i]],
+                rank=rank_names[rank_indices[i]],
+                states=generate_states(
+                    soldier_id,
+                    state_count,
+                    BRANCHES[branch_indices[i]],
+                    initial_posts[i],
+                    transfer_scopes[offset:next_offset],
+                ),
+            ))
+            offset = next_offset
+        return soldiers
+
     def _generate_name(self) -> Tuple[str, str, str]:
         """Generate a name tuple."""
         first = self.rng.choice(FIRST_NAMES)
@@ -87,37 +160,43 @@ class SoldierFactory:
 
     def _generate_rank(self) -> str:
         """Sample a rank."""
-        return self.rng.choice(self.rank_names, p=self.rank_weights)
+        roll = self.rng.random() * self._rank_cum_weights[-1]
+        index = bisect.bisect(self._rank_cum_weights, roll)
+        return self.rank_names[min(index, len(self.rank_names) - 1)]
 
     def _sample_state_count(self) -> int:
         """Sample state count: 65% one, 28% two, 7% three."""
-        return int(self.rng.choice([1, 2, 3], p=[0.65, 0.28, 0.07]))
+        index = STATE_COUNT_CUM_WEIGHTS.searchsorted(self.rng.random(), side="right")
+        return STATE_COUNTS[int(index)]
 
     def _sample_branch(self) -> Branch:
         """Sample a branch uniformly."""
-        return self.rng.choice(list(Branch))
-
-    def _sample_transfer_scope(self) -> TransferScope:
-        """Sample transfer scope for a new state."""
-        scopes = [
-            TransferScope.WITHIN_LEVEL3,
-            TransferScope.WITHIN_LEVEL2,
-            TransferScope.WITHIN_BRANCH,
-            TransferScope.CROSS_BRANCH,
-        ]
-        weights = [0.20, 0.30, 0.35, 0.15]
-        return self.rng.choice(scopes, p=weights)
+        return BRANCHES[self.rng.integers(len(BRANCHES))]
+
+    def _sample_transfer_scopes(self, count: int) -> List[TransferScope]:
+        """Sample transfer scopes for successive states from one uniform block."""
+        indices = TRANSFER_SCOPE_CUM_WEIGHTS.searchsorted(self.rng.random(count), side="right")
+        return [TRANSFER_SCOPES[i] for i in indices]
 
-    def _generate_states(self, soldier_id: str, state_count: int) -> List[State]:
-        """Generate 1-3 states with transfers."""
+    def _generate_states(
+        self,
+        soldier_id: str,
+        state_count: int,
+        branch: Optional[Branch] = None,
+        post_levels: Optional[Dict[str, str]] = None,
+        transfer_scopes: Optional[List[TransferScope]] = None,
+    ) -> List[State]:
+        """Generate 1-3 states with transfers, sampling the first post and scopes if not given."""
         states: List[State] = []
 
-        branch = self._sample_branch()
-        post_levels = self._generate_post(branch)
+        if branch is None or post_levels is None:
+            branch = self._sample_branch()
+            post_levels = self._generate_post(branch)
         states.append(self._create_state(soldier_id, 1, branch, post_levels))
 
-        for i in range(1, state_count):
-            transfer_scope = self._sample_transfer_scope()
+        if transfer_scopes is None:
+            transfer_scopes = self._sample_transfer_scopes(state_count - 1)
+        for i, transfer_scope in enumerate(transfer_scopes, start=1):
             branch, post_levels = self.transfer_manager.apply_transfer(
                 states[-1].branch,
                 states[-1].post_levels,
@@ -127,19 +206,59 @@ class SoldierFactory:
 
         return states
 
+    def _get_branch_levels(self, branch: Branch) -> Tuple[str, ...]:
+        """Return ordered level names for a branch from the transfer manager's cache."""
+        return self.transfer_manager.get_branch_levels(branch)
+
+    def _get_level_values(self, branch: Branch, level: str) -> Tuple[str, ...]:
+        """Return level designators from the transfer manager's cache."""
+        return self.transfer_manager.get_level_values(branch, level)
+
     def _generate_post(self, branch: Branch) -> Dict[str, str]:
         """Generate a post path for a branch."""
         post_levels: Dict[str, str] = {}
-        for level in self.hierarchy.get_branch_levels(branch):
-            values = self.hierarchy.get_level_values(branch, level)
-            post_levels[level] = self.rng.choice(values)
+        levels = self._get_branch_levels(branch)
+        draws = self.rng.random(len(levels)).tolist()
+        get_values = self._get_level_values
+        for level, draw in zip(levels, draws):
+            values = get_values(branch, level)
+            post_levels[level] = values[int(draw * len(values))]
         return post_levels
 
-    def _build_post_path(self, branch: Branch, post_levels: Dict[str, str]) -> str:
-        """Build a full post path string."""
-        ordered_levels = self.hierarchy.get_branch_levels(branch)
-        parts = [post_levels[level] for level in ordered_levels if level in post_levels]
-        return "/".join(parts)
+    def _generate_posts(self, branch: Branch, count: int) -> List[Dict[str, str]]:
+        """Generate count post paths for a branch with one draw per level."""
+        posts: List[Dict[str, str]] = [{} for _ in range(count)]
+        if not count:
+            return posts
+        for level in self._get_branch_levels(branch):
+            values = self._get_level_values(branch, level)
+            indices = self.rng.integers(len(values), size=count).tolist()
+            for post, index in zip(posts, indices):
+                post[level] = values[index]
+        return posts
+
+    def _get_post(
+        self,
+        branch: Branch,
+        post_levels: Dict[str, str],
+    ) -> Tuple[str, Dict[str, str], CollisionSeverity, Tuple[str, ...]]:
+        """Return the shared (path, levels, severity, colliding paths) record for a post."""
+        key = (branch, tuple(post_levels.items()))
+        post = self._posts.get(key)
+        if post is None:
+            ordered_levels = self._get_branch_levels(branch)
+            post_path = "/".join(
+                post_levels[level] for level in ordered_levels if level in post_levels
+            )
+            severity = self.hierarchy.get_collision_severity(branch, post_levels)
+            colliding_paths = (
+                tuple(self.hierarchy.get_colliding_paths(branch, post_levels))
+                if severity != CollisionSeverity.NONE
+                else ()
+            )
+            post = (post_path, post_levels, severity, colliding_paths)
+            self._posts[key] = post
+        return post
 
     def _create_state(
         self,
@@ -149,11 +268,9 @@ class SoldierFactory:
         post_levels: Dict[str, str],
     ) -> State:
         """Create a state with collision zone tagging."""
-        post_path = self._build_post_path(branch, post_levels)
-
-        collision_severity = self.hierarchy.get_collision_severity(branch, post_levels)
-        collision_zone_flag = collision_severity != CollisionSeverity.NONE
-        colliding_paths = self.hierarchy.get_colliding_paths(branch, post_levels)
+        post_path, post_levels, collision_severity, colliding_paths = self._get_post(
+            branch, post_levels
+        )
 
         return State(
             state_id=f"{soldier_id}-{state_order}",
@@ -162,7 +279,7 @@ class SoldierFactory:
             branch=branch,
             post_path=post_path,
             post_levels=post_levels,
-            collision_zone_flag=collision_zone_flag,
+            collision_zone_flag=collision_severity != CollisionSeverity.NONE,
             collision_severity=collision_severity,
-            colliding_paths=colliding_paths,
+            colliding_paths=list(colliding_paths),
         )
@@ -2,8 +2,11 @@
 SourceGenerator: Create source documents with assigned clerks and situations.
 """
 
-import random
-from typing import Dict, Optional
+import bisect
+from itertools import accumulate
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 from .models import Branch, Clerk, Situation, Source
 from .clerk_factory import ClerkFactory
@@ -18,6 +21,9 @@ QUALITY_TIER_WEIGHTS = {
     5: 0.05,
 }
 
+QUALITY_TIERS = tuple(QUALITY_TIER_WEIGHTS)
+QUALITY_TIER_CUM_WEIGHTS = tuple(accumulate(QUALITY_TIER_WEIGHTS.values()))
+
 ARCHETYPE_BIAS = {
     1: ["sector_formal", "sector_efficient", "processing_intake"],
     2: ["fleet_methodical", "transport_shuttle", "sector_efficient"],
@@ -35,12 +41,14 @@ class SourceGenerator:
         clerk_factory: ClerkFactory,
         situation_manager: SituationManager,
         random_seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
     ):
-        self.rng = random.Random(random_seed)
+        self.rng = rng if rng is not None else np.random.default_rng(random_seed)
         self.clerk_factory = clerk_factory
         self.situation_manager = situation_manager
         self._source_counter = 0
         self.sources: Dict[str, Source] = {}
+        self._archetype_pools: Dict[Tuple[int, Branch], Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
 
     def _generate_source_id(self) -> str:
         """Generate a unique source ID."""
@@ -49,30 +57,47 @@ class SourceGenerator:
 
     def _select_quality_tier(self) -> int:
         """Select a quality tier based on distribution weights."""
-        tiers = list(QUALITY_TIER_WEIGHTS.keys())
-        weights = [QUALITY_TIER_WEIGHTS[t] for t in tiers]
-        return self.rng.choices(tiers, weights=weights)[0]
+        roll = self.rng.random() * QUALITY_TIER_CUM_WEIGHTS[-1]
+        index = bisect.bisect(QUALITY_TIER_CUM_WEIGHTS, roll)
+        return QUALITY_TIERS[min(index, len(QUALITY_TIERS) - 1)]
 
     def _select_archetype_for_tier(self, tier: int, branch: Branch) -> str:
         """Select an archetype biased by quality tier and branch."""
-        biased = ARCHETYPE_BIAS.get(tier, [])
-        available = set(self.clerk_factory.list_archetypes())
-        allowed = [
-            archetype for archetype in self.situation_manager.get_archetype_pool(branch.value)
-            if archetype in available
-        ]
-        biased = [archetype for archetype in biased if archetype in available]
+        biased, allowed = self._get_archetype_pools(tier, branch)
 
         if biased and self.rng.random() < 0.7:
-            candidates = [a for a in biased if not allowed or a in allowed]
-            if candidates:
-                return self.rng.choice(candidates)
+            return biased[self.rng.integers(len(biased))]
 
         if allowed:
-            return self.rng.choice(allowed)
+            return allowed[self.rng.integers(len(allowed))]
 
         return self.clerk_factory.get_random_archetype()
 
+    def _get_archetype_pools(
+        self,
+        tier: int,
+        branch: Branch,
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Return (biased, allowed) archetypes for a tier and branch, cached per generator.
+
+        Biased archetypes are already restricted to the allowed pool when it is non-empty.
+        """
+        key = (tier, branch)
+        pools = self._archetype_pools.get(key)
+        if pools is None:
+            available = set(self.clerk_factory.list_archetypes())
+            allowed = tuple(
+                archetype for archetype in self.situation_manager.get_archetype_pool(branch.value)
+                if archetype in available
+            )
+            biased = tuple(
+                archetype for archetype in ARCHETYPE_BIAS.get(tier, [])
+                if archetype in available and (not allowed or archetype in allowed)
+            )
+            pools = (biased, allowed)
+            self._archetype_pools[key] = pools
+        return pools
+
     def create_source(
         self,
         branch: Branch,
@@ -96,7 +121,7 @@ class SourceGenerator:
             situation = self.situation_manager.assign_situation(branch.value)
 
         if temporal_anchor is None:
-            temporal_anchor = self.rng.choice([1, 2, 3])
+            temporal_anchor = self.rng.integers(1, 4)
 
         source = Source(
             source_id=source_id,
@@ -2,7 +2,8 @@
 TransferManager: Apply transfers between soldier states.
 """
 
-from typing import Dict, Tuple
+import sys
+from typing import Dict, List, Tuple
 
 import numpy as np
 
@@ -10,12 +11,24 @@ from .hierarchy_loader import HierarchyLoader
 from .models import Branch, TransferScope
 
 
+OTHER_BRANCHES = {
+    branch: tuple(b for b in Branch if b != branch)
+    for branch in Branch
+}
+
+UNIFORM_POOL_SIZE = 4096
+
+
 class TransferManager:
     """Manages transfers for soldier state transitions."""
 
     def __init__(self, hierarchy: HierarchyLoader, rng: np.random.Generator):
         self.hierarchy = hierarchy
         self.rng = rng
+        self._branch_depths: Dict[Branch, int] = {}
+        self._branch_levels: Dict[Branch, Tuple[str, ...]] = {}
+        self._level_values: Dict[Tuple[Branch, str], Tuple[str, ...]] = {}
+        self._uniform_pool: List[float] = []
 
     def apply_transfer(
         self,
@@ -24,13 +37,11 @@ class TransferManager:
         scope: TransferScope,
     ) -> Tuple[Branch, Dict[str, str]]:
         """Apply a transfer to the current post based on scope."""
-        depth = self.hierarchy.get_branch_depth(branch)
-        levels = self.hierarchy.get_branch_levels(branch)
-
         if scope == TransferScope.CROSS_BRANCH:
             return self._transfer_cross_branch(branch)
 
-        if scope == TransferScope.WITHIN_LEVEL3 and depth <= 3:
+        levels = self.get_branch_levels(branch)
+        if scope == TransferScope.WITHIN_LEVEL3 and self._get_branch_depth(branch) <= 3:
             scope = TransferScope.WITHIN_LEVEL2
 
         if scope == TransferScope.WITHIN_LEVEL3:
@@ -57,17 +68,49 @@ class TransferManager:
 
     def _transfer_cross_branch(self, branch: Branch) -> Tuple[Branch, Dict[str, str]]:
         """Transfer to a different branch and new post."""
-        branches = [b for b in Branch if b != branch]
-        new_branch = self.rng.choice(branches)
+        others = OTHER_BRANCHES[branch]
+        new_branch = others[int(self._next_uniform() * len(others))]
         return new_branch, self._generate_post(new_branch)
 
     def _generate_post(self, branch: Branch) -> Dict[str, str]:
-        """Generate a new post for a branch."""
+        """Generate a new post for a branch from one pooled uniform per level."""
         post_levels: Dict[str, str] = {}
-        for level in self.hierarchy.get_branch_levels(branch):
-            post_levels[level] = self._sample_level_value(branch, level)
+        for level in self.get_branch_levels(branch):
+            values = self.get_level_values(branch, level)
+            if values:
+                post_levels[level] = values[int(self._next_uniform() * len(values))]
+            else:
+                post_levels[level] = ""
         return post_levels
 
+    def _get_branch_depth(self, branch: Branch) -> int:
+        """Return the configured depth for a branch, cached per manager."""
+        depth = self._branch_depths.get(branch)
+        if depth is None:
+            depth = self.hierarchy.get_branch_depth(branch)
+            self._branch_depths[branch] = depth
+        return depth
+
+    def get_branch_levels(self, branch: Branch) -> Tuple[str, ...]:
+        """Return ordered level names for a branch, cached per manager."""
+        levels = self._branch_levels.get(branch)
+        if levels is None:
+            levels = tuple(sys.intern(level) for level in self.hierarchy.get_branch_levels(branch))
+            self._branch_levels[branch] = levels
+        return levels
+
+    def get_level_values(self, branch: Branch, level: str) -> Tuple[str, ...]:
+        """Return interned level designators for a branch level, cached per manager."""
+        key = (branch, level)
+        values = self._level_values.get(key)
+        if values is None:
+            values = tuple(
+                sys.intern(str(value))
+                for value in self.hierarchy.get_level_values(branch, level)
+            )
+            self._level_values[key] = values
+        return values
+
     def _sample_level_value(
         self,
         branch: Branch,
@@ -75,9 +118,17 @@ class TransferManager:
         exclude: str = "",
     ) -> str:
         """Sample a value for a level, avoiding an exclude if possible."""
-        values = self.hierarchy.get_level_values(branch, level)
+        values = self.get_level_values(branch, level)
         if not values:
             return exclude
-        if exclude and exclude in values and len(values) > 1:
-            values = [v for v in values if v != exclude]
-        return self.rng.choice(values)
+        if exclude and len(values) > 1 and exclude in values:
+            exclude_index = values.index(exclude)
+            index = int(self._next_uniform() * (len(values) - 1))
+            return values[index + 1 if index >= exclude_index else index]
+        return values[int(self._next_uniform() * len(values))]
+
+    def _next_uniform(self) -> float:
+        """Return the next uniform from a pool refilled in blocks from the generator."""
+        if not self._uniform_pool:
+            self._uniform_pool = self.rng.random(UNIFORM_POOL_SIZE).tolist()
+        return self._uniform_pool.pop()
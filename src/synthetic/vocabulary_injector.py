@@ -61,6 +61,9 @@ class VocabularyInjector:
         self.situational_terms: Dict[str, List[str]] = {}
         self.clutter_terms: Dict[str, List[str]] = {}
         self.confounder_terms: List[str] = []
+        self._clerk_profiles: Dict[
+            Tuple[str, VocabularyDensity], Tuple[float, float, Tuple[str, ...]]
+        ] = {}
 
         if vocabulary_path:
             self.load_vocabulary(vocabulary_path)
@@ -78,6 +81,7 @@ class VocabularyInjector:
         for values in confounders.values():
             combined.extend(values)
         self.confounder_terms = combined
+        self._clerk_profiles = {}
 
     def inject_vocabulary(
         self,
@@ -92,43 +96,60 @@ class VocabularyInjector:
             "confounder": [],
         }
 
-        result = entry_text
+        parts = [entry_text]
 
-        situational_rate = SITUATIONAL_DENSITY.get(clerk.vocabulary_density, 0.35)
-        if self.rng.random() < situational_rate:
+        situational_rate, clutter_rate, clutter_pool = self._get_clerk_profile(clerk)
+        rng_random = self.rng.random
+        situational_roll, clutter_roll, confounder_roll = rng_random(), rng_random(), rng_random()
+
+        if situational_roll < situational_rate:
             term = self._sample_situational(situation)
             if term:
-                result = self._append_term(result, term)
+                parts.extend((self._term_separator(), term))
                 injected["situational"].append(term)
 
-        clutter_rate = CLUTTER_RATES.get(clerk.archetype_id, 0.15)
-        if self.rng.random() < clutter_rate:
-            clutter_term = self._sample_clutter(clerk)
+        if clutter_roll < clutter_rate:
+            clutter_term = self._sample_clutter(clutter_pool)
             if clutter_term:
-                result = self._append_term(result, clutter_term)
+                parts.extend((self._term_separator(), clutter_term))
                 injected["clutter"].append(clutter_term)
 
-        if self.rng.random() < CONFOUNDER_RATE:
+        if confounder_roll < CONFOUNDER_RATE:
             confounder = self._sample_confounder()
             if confounder:
-                result = self._append_term(result, confounder)
+                parts.extend((self._term_separator(), confounder))
                 injected["confounder"].append(confounder)
 
-        return result, injected
+        if len(parts) == 1:
+            return entry_text, injected
+        return "".join(parts), injected
+
+    def _get_clerk_profile(self, clerk: Clerk) -> Tuple[float, float, Tuple[str, ...]]:
+        """Return (situational rate, clutter rate, clutter pool), cached per archetype/density."""
+        key = (clerk.archetype_id, clerk.vocabulary_density)
+        profile = self._clerk_profiles.get(key)
+        if profile is None:
+            category = ARCHETYPE_TO_CLUTTER.get(clerk.archetype_id, "operations")
+            profile = (
+                SITUATIONAL_DENSITY.get(clerk.vocabulary_density, 0.35),
+                CLUTTER_RATES.get(clerk.archetype_id, 0.15),
+                tuple(self.clutter_terms.get(category, [])),
+            )
+            self._clerk_profiles[key] = profile
+        return profile
 
     def _sample_situational(self, situation: Situation) -> Optional[str]:
         """Sample a situational term for a situation."""
-        pool = situation.vocabulary_pool.primary
-        if not pool:
-            pool = self.situational_terms.get(situation.situation_id, [])
+        pool = (
+            situation.vocabulary_pool.primary
+            or self.situational_terms.get(situation.situation_id)
+        )
         if not pool:
             return None
         return self.rng.choice(pool)
 
-    def _sample_clutter(self, clerk: Clerk) -> Optional[str]:
-        """Sample clutter terms for a clerk's context."""
-        category = ARCHETYPE_TO_CLUTTER.get(clerk.archetype_id, "operations")
-        pool = self.clutter_terms.get(category, [])
+    def _sample_clutter(self, pool: Tuple[str, ...]) -> Optional[str]:
+        """Sample a clutter term from a clerk's clutter pool."""
         if not pool:
             return None
         return self.rng.choice(pool)
@@ -139,8 +160,8 @@ class VocabularyInjector:
             return None
         return self.rng.choice(self.confounder_terms)
 
-    def _append_term(self, text: str, term: str) -> str:
-        """Append a term to entry text with appropriate spacing."""
+    def _term_separator(self) -> str:
+        """Return the spacing placed before an appended term."""
         if self.rng.random() < 0.3:
-            return f"{text}  {term}"
-        return f"{text} {term}"
+            return "  "
+        return " "
@@ -7,16 +7,26 @@ Pricing is managed centrally in src/utils/llm/config.py
 """
 
 import json
+import itertools
+import os
+import queue
 import time
-from datetime import datetime
+import weakref
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 import threading
+from functools import cache
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json for the cost report
+    orjson = None
 
+
+@cache
 def _get_pricing() -> Dict[str, Dict[str, float]]:
     """
-    Get pricing from the LLM config module.
+    Get pricing from the LLM config module, loaded once per process.
 
     Returns dict mapping model_name -> {"input": price, "output": price}
     """
@@ -43,24 +53,164 @@ def _get_pricing() -> Dict[str, Dict[str, float]]:
         }
 
 
-# Lazy-loaded pricing (populated on first use)
-PRICING: Optional[Dict[str, Dict[str, float]]] = None
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_BATCH_ENTRIES = 64
+
+# Writer-thread control markers queued alongside log entries
+_LOG_FLUSH = object()
+_LOG_STOP = object()
+
+# Flattens prompt previews onto a single log line
+PREVIEW_TRANSLATION = str.maketrans({"\n": " ", "\r": " "})
+
+
+def _write_json_report(path: Path, report: Dict[str, Any]):
+    """Write a report as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+def _local_time_str(fmt: str, t: float) -> str:
+    """Format an epoch timestamp as local time without building a datetime."""
+    return time.strftime(fmt, time.localtime(t))
 
 
-def get_pricing() -> Dict[str, Dict[str, float]]:
-    """Get pricing dict, loading from config if needed."""
-    global PRICING
-    if PRICING is None:
-        PRICING = _get_pricing()
-    return PRICING
+# Public name kept for existing callers; the cached loader is thread-safe
+get_pricing = _get_pricing
+
+
+def __getattr__(name: str):
+    # PRICING used to be a lazily populated module global
+    if name == "PRICING":
+        return get_pricing()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _write_all(fd: int, data: Union[bytes, bytearray]):
+    """Write every byte to fd, retrying partial writes."""
+    written = 0
+    with memoryview(data) as view:
+        while written < len(view):
+            written += os.write(fd, view[written:])
+
+
+class _LogWriter:
+    """
+    Appends log text to a file from a background thread.
+
+    The thread and its fd are only created once something is logged, and
+    close() drains and stops them. After close(), messages are appended
+    synchronously so late entries are never lost.
+    """
+
+    def __init__(self, path: Path, header: str):
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = None
+        self._fd = None
+        self._closed = False
+        # Guards starting/stopping the thread; the writer thread never takes it
+        self._lock = threading.Lock()
+
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+        try:
+            _write_all(fd, header.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def put(self, message: Union[str, List[str]]):
+        """Queue a message, or a list of message chunks, for the writer thread."""
+        with self._lock:
+            if self._closed:
+                self._write_sync(message)
+                return
+            if self._thread is None:
+                self._fd = os.open(str(self.path), os.O_WRONLY | os.O_APPEND)
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._queue.put(message)
+
+    def flush(self):
+        """Ask the writer thread to write out its buffer."""
+        with self._lock:
+            if self._thread is not None and not self._closed:
+                self._queue.put(_LOG_FLUSH)
+
+    def is_alive(self) -> bool:
+        """Return whether the writer thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def close(self):
+        """Drain pending entries, stop the thread and close the fd; safe to repeat."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._thread is not None:
+                self._queue.put(_LOG_STOP)
+                self._thread.join()
+
+    def _write_sync(self, message: Union[str, List[str]]):
+        """Append a message directly, for entries logged after close()."""
+        text = "".join(message) if isinstance(message, list) else message
+        fd = os.open(str(self.path), os.O_WRONLY | os.O_APPEND)
+        try:
+            _write_all(fd, text.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def _run(self):
+        """Drain queued log entries onto the log file in batches until stopped."""
+        log_q = self._queue
+        log_buf = bytearray()
+        while True:
+            batch = [log_q.get()]
+            while len(batch) < LOG_BATCH_ENTRIES:
+                try:
+                    batch.append(log_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = flush = False
+            entries = []
+            for item in batch:
+                if item is _LOG_STOP:
+                    stop = True
+                elif item is _LOG_FLUSH:
+                    flush = True
+                elif isinstance(item, list):
+                    entries.extend(item)
+                else:
+                    entries.append(item)
+
+            log_buf += "".join(entries).encode("utf-8")
+            if stop or flush or len(log_buf) >= LOG_BUFFER_SIZE:
+                _write_all(self._fd, log_buf)
+                log_buf.clear()
+            if stop:
+                os.close(self._fd)
+                self._fd = None
+                return
 
 
 class CostTracker:
     """Tracks API costs and execution metrics for a single task."""
 
-    def __init__(self, task_name: str, model_name: str, log_dir: str = "logs"):
+    def __init__(
+        self,
+        task_name: str,
+        model_name: str,
+        log_dir: str = "logs",
+        log_previews: bool = True,
+    ):
         self.task_name = task_name
         self.model_name = model_name
+        self.log_previews = log_previews
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
 
@@ -69,47 +219,65 @@ class CostTracker:
         self.phases = {}
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cost = 0.0
         self.api_calls = 0
+        self._call_numbers = itertools.count(1)
         self.errors = []
         self.parameters = {}
 
+        # Per-token prices are fixed for the tracker's model
+        pricing = get_pricing().get(model_name, {"input": 0, "output": 0})
+        self._input_price = pricing["input"] / 1_000_000
+        self._output_price = pricing["output"] / 1_000_000
+
+        # (epoch second, "HH:MM:SS") of the last formatted log timestamp
+        self._ts_cache = (0, "")
+
         # Create timestamped log file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _local_time_str("%Y%m%d_%H%M%S", self.start_time)
         self.log_file = self.log_dir / f"{task_name}_{timestamp}.log"
         self.cost_file = self.log_dir / f"{task_name}_{timestamp}_cost.json"
 
-        # Thread lock for concurrent writes
+        # Thread lock for tracking state; log I/O happens on the writer thread
         self._lock = threading.Lock()
 
-        self._write_header()
-
-    def _write_header(self):
-        """Write log header with task info."""
-        with open(self.log_file, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write(f"RESOLVER GENERATION LOG\n")
-            f.write(f"Task: {self.task_name}\n")
-            f.write(f"Model: {self.model_name}\n")
-            f.write(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("="*80 + "\n\n")
+        self._writer = _LogWriter(self.log_file, self._header())
+        # Stops the writer when the tracker is collected or at interpreter exit;
+        # holds no reference to the tracker itself
+        self._close_writer = weakref.finalize(self, self._writer.close)
+
+    def _header(self) -> str:
+        """Build log header with task info."""
+        return "".join([
+            "="*80 + "\n",
+            "RESOLVER GENERATION LOG\n",
+            f"Task: {self.task_name}\n",
+            f"Model: {self.model_name}\n",
+            f"Started: {_local_time_str('%Y-%m-%d %H:%M:%S', self.start_time)}\n",
+            "="*80 + "\n\n",
+        ])
 
     def set_parameters(self, params: Dict[str, Any]):
         """Set task parameters for logging."""
         with self._lock:
             self.parameters.update(params)
-            self._append_log(f"\nTASK PARAMETERS:\n{json.dumps(params, indent=2)}\n")
+        self._append_log(f"\nTASK PARAMETERS:\n{json.dumps(params, indent=2)}\n")
 
     def start_phase(self, phase_name: str):
         """Start tracking a phase."""
         with self._lock:
+            # Full final key set up front so end_phase only overwrites values
             self.phases[phase_name] = {
                 "start_time": time.time(),
+                "end_time": None,
+                "duration": None,
                 "input_tokens": 0,
                 "output_tokens": 0,
                 "api_calls": 0,
+                "cost": 0.0,
                 "status": "running"
             }
-            self._append_log(f"\n[{self._timestamp()}] PHASE START: {phase_name}\n")
+        self._append_log(f"\n[{self._timestamp()}] PHASE START: {phase_name}\n")
 
     def end_phase(self, phase_name: str, status: str = "completed"):
         """End tracking a phase."""
@@ -121,14 +289,9 @@ class CostTracker:
             phase["end_time"] = time.time()
             phase["duration"] = phase["end_time"] - phase["start_time"]
             phase["status"] = status
+            cost = phase["cost"]
 
-            cost = self._calculate_cost(
-                phase["input_tokens"],
-                phase["output_tokens"]
-            )
-            phase["cost"] = cost
-
-            self._append_log(
+            log_entry = (
                 f"[{self._timestamp()}] PHASE END: {phase_name} - {status}\n"
                 f"  Duration: {phase['duration']:.2f}s\n"
                 f"  API Calls: {phase['api_calls']}\n"
@@ -136,88 +299,106 @@ class CostTracker:
                 f"  Output Tokens: {phase['output_tokens']:,}\n"
                 f"  Cost: ${cost:.4f}\n"
             )
+        self._append_log(log_entry)
+        self._writer.flush()
 
     def record_api_call(self, phase_name: str, input_tokens: int, output_tokens: int,
                        prompt_preview: Optional[str] = None, error: Optional[str] = None):
         """Record an API call with token counts."""
+        timestamp = self._timestamp()
+        call_cost = self._calculate_cost(input_tokens, output_tokens)
+        # next() on itertools.count is atomic, so numbering needs no lock
+        call_number = next(self._call_numbers)
         with self._lock:
             self.api_calls += 1
             self.total_input_tokens += input_tokens
             self.total_output_tokens += output_tokens
+            self.total_cost += call_cost
 
+            # Phase cost accumulates per call, so end_phase only reads it
             if phase_name in self.phases:
-                self.phases[phase_name]["api_calls"] += 1
-                self.phases[phase_name]["input_tokens"] += input_tokens
-                self.phases[phase_name]["output_tokens"] += output_tokens
+                phase = self.phases[phase_name]
+                phase["api_calls"] += 1
+                phase["input_tokens"] += input_tokens
+                phase["output_tokens"] += output_tokens
+                phase["cost"] += call_cost
 
-            log_entry = (
-                f"[{self._timestamp()}] API CALL #{self.api_calls} ({phase_name})\n"
-                f"  Input: {input_tokens:,} tokens | Output: {output_tokens:,} tokens\n"
-                f"  Cost: ${self._calculate_cost(input_tokens, output_tokens):.4f}\n"
-            )
+        # Format outside the lock; the writer thread does the file I/O
+        log_entry = (
+            f"[{timestamp}] API CALL #{call_number} ({phase_name})\n"
+            f"  Input: {input_tokens:,} tokens | Output: {output_tokens:,} tokens\n"
+            f"  Cost: ${call_cost:.4f}\n"
+        )
 
-            if prompt_preview:
-                preview = prompt_preview[:200].replace('\n', ' ')
-                log_entry += f"  Prompt: {preview}...\n"
+        if prompt_preview and self.log_previews:
+            preview = prompt_preview[:200].translate(PREVIEW_TRANSLATION)
+            log_entry += f"  Prompt: {preview}...\n"
 
-            if error:
-                self.errors.append({"phase": phase_name, "error": error, "time": self._timestamp()})
-                log_entry += f"  ERROR: {error}\n"
+        if error:
+            self.errors.append({"phase": phase_name, "error": error, "time": timestamp})
+            log_entry += f"  ERROR: {error}\n"
 
-            self._append_log(log_entry)
+        self._append_log(log_entry)
 
     def record_event(self, event: str, details: Optional[str] = None):
         """Record a general event."""
-        with self._lock:
-            log_entry = f"[{self._timestamp()}] {event}\n"
-            if details:
-                log_entry += f"  {details}\n"
-            self._append_log(log_entry)
+        log_entry = f"[{self._timestamp()}] {event}\n"
+        if details:
+            log_entry += f"  {details}\n"
+        self._append_log(log_entry)
 
     def finalize(self):
         """Finalize the tracking and write summary."""
         with self._lock:
             end_time = time.time()
             total_duration = end_time - self.start_time
-            total_cost = self._calculate_cost(self.total_input_tokens, self.total_output_tokens)
+            total_cost = self.total_cost
 
             # Write summary to log
-            summary = f"\n{'='*80}\n"
-            summary += "EXECUTION SUMMARY\n"
-            summary += f"{'='*80}\n"
-            summary += f"Total Duration: {total_duration:.2f}s ({total_duration/60:.2f} minutes)\n"
-            summary += f"Total API Calls: {self.api_calls}\n"
-            summary += f"Total Input Tokens: {self.total_input_tokens:,}\n"
-            summary += f"Total Output Tokens: {self.total_output_tokens:,}\n"
-            summary += f"Total Cost: ${total_cost:.4f}\n"
-            summary += f"\nPHASE BREAKDOWN:\n"
-
-            for phase_name, phase in self.phases.items():
-                if "duration" in phase:
-                    summary += (
-                        f"  {phase_name}:\n"
-                        f"    Duration: {phase['duration']:.2f}s\n"
-                        f"    API Calls: {phase['api_calls']}\n"
-                        f"    Tokens: {phase['input_tokens']:,} in / {phase['output_tokens']:,} out\n"
-                        f"    Cost: ${phase.get('cost', 0):.4f}\n"
-                    )
+            parts = [
+                f"\n{'='*80}\n"
+                "EXECUTION SUMMARY\n"
+                f"{'='*80}\n"
+                f"Total Duration: {total_duration:.2f}s ({total_duration/60:.2f} minutes)\n"
+                f"Total API Calls: {self.api_calls}\n"
+                f"Total Input Tokens: {self.total_input_tokens:,}\n"
+                f"Total Output Tokens: {self.total_output_tokens:,}\n"
+                f"Total Cost: ${total_cost:.4f}\n"
+                "\nPHASE BREAKDOWN:\n"
+            ]
+
+            parts.extend(
+                f"  {phase_name}:\n"
+                f"    Duration: {phase['duration']:.2f}s\n"
+                f"    API Calls: {phase['api_calls']}\n"
+                f"    Tokens: {phase['input_tokens']:,} in / {phase['output_tokens']:,} out\n"
+                f"    Cost: ${phase['cost']:.4f}\n"
+                for phase_name, phase in self.phases.items()
+                if phase["duration"] is not None
+            )
 
             if self.errors:
-                summary += f"\nERRORS ENCOUNTERED: {len(self.errors)}\n"
-                for err in self.errors:
-                    summary += f"  [{err['time']}] {err['phase']}: {err['error']}\n"
-
-            summary += f"\nLog file: {self.log_file}\n"
-            summary += f"Cost report: {self.cost_file}\n"
+                parts.append(f"\nERRORS ENCOUNTERED: {len(self.errors)}\n")
+                parts.extend(
+                    f"  [{err['time']}] {err['phase']}: {err['error']}\n"
+                    for err in self.errors
+                )
+
+            parts.append(
+                f"\nLog file: {self.log_file}\n"
+                f"Cost report: {self.cost_file}\n"
+            )
+            self._append_log(parts)
 
-            self._append_log(summary)
+            # Drain the writer thread before writing the JSON report
+            self.close()
 
             # Write detailed cost report
             cost_report = {
                 "task_name": self.task_name,
                 "model": self.model_name,
-                "start_time": datetime.fromtimestamp(self.start_time).isoformat(),
-                "end_time": datetime.fromtimestamp(end_time).isoformat(),
+                "start_time": _local_time_str("%Y-%m-%dT%H:%M:%S", self.start_time),
+                "end_time": _local_time_str("%Y-%m-%dT%H:%M:%S", end_time),
                 "duration_seconds": round(total_duration, 2),
                 "parameters": self.parameters,
                 "totals": {
@@ -232,8 +413,7 @@ class CostTracker:
                 "pricing": get_pricing().get(self.model_name, {})
             }
 
-            with open(self.cost_file, 'w') as f:
-                json.dump(cost_report, f, indent=2)
+            _write_json_report(self.cost_file, cost_report)
 
             print(f"\n{'='*80}")
             print(f"Cost Tracking Summary")
@@ -248,46 +428,59 @@ class CostTracker:
 
     def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Calculate cost based on token counts."""
-        pricing = get_pricing().get(self.model_name, {"input": 0, "output": 0})
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-        return input_cost + output_cost
+        return input_tokens * self._input_price + output_tokens * self._output_price
 
     def _timestamp(self) -> str:
-        """Get current timestamp string."""
-        return datetime.now().strftime("%H:%M:%S")
+        """Get current timestamp string, reusing the last one within the same second."""
+        now = int(time.time())
+        cached_second, cached = self._ts_cache
+        if now == cached_second:
+            return cached
+        stamp = _local_time_str("%H:%M:%S", now)
+        self._ts_cache = (now, stamp)
+        return stamp
 
-    def _append_log(self, message: str):
-        """Append message to log file."""
-        with open(self.log_file, 'a') as f:
-            f.write(message)
+    def _append_log(self, message: Union[str, List[str]]):
+        """Queue a message, or a list of message chunks, for the log writer."""
+        self._writer.put(message)
 
+    def close(self):
+        """Drain pending log entries and stop the log writer; safe to call more than once."""
+        self._close_writer()
 
-class MockCostTracker:
-    """Mock tracker for dry-run mode."""
 
-    def __init__(self, *args, **kwargs):
-        pass
+# Public CostTracker methods the mock stands in for; anything else (typos,
+# private helpers) still raises AttributeError
+_TRACKER_METHODS = frozenset(
+    name for name, member in vars(CostTracker).items()
+    if callable(member) and not name.startswith("_")
+)
 
-    def set_parameters(self, params):
-        pass
 
-    def start_phase(self, phase_name):
-        pass
-
-    def end_phase(self, phase_name, status="completed"):
-        pass
+class MockCostTracker:
+    """Mock tracker for dry-run mode; every tracker method is a no-op."""
 
-    def record_api_call(self, *args, **kwargs):
+    def __init__(self, *args, **kwargs):
         pass
 
-    def record_event(self, *args, **kwargs):
-        pass
+    def __getattr__(self, name):
+        # Only reached for missing attributes; cache the no-op on the instance
+        if name not in _TRACKER_METHODS:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        setattr(self, name, _noop)
+        return _noop
 
     def finalize(self):
         print("\n[DRY RUN MODE] No costs to track")
 
 
+def _noop(*args, **kwargs):
+    """Accept any arguments and do nothing."""
+    return None
+
+
 def estimate_tokens(text: str) -> int:
     """Rough estimate of tokens (1 token ≈ 4 characters)."""
     return len(text) // 4
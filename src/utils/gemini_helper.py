@@ -4,9 +4,8 @@ Loads API key securely from environment variables
 """
 
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage, SystemMessage
 
 # Load environment variables from .env file
 load_dotenv()
@@ -28,6 +27,9 @@ def get_gemini_model(model_name="gemini-1.5-flash", temperature=0.7, **kwargs):
     Raises:
         ValueError: If GEMINI_API_KEY is not set
     """
+    # Imported on first use so loading this module stays cheap
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     api_key = os.getenv("GEMINI_API_KEY")
 
     if not api_key:
@@ -47,6 +49,22 @@ def get_gemini_model(model_name="gemini-1.5-flash", temperature=0.7, **kwargs):
     return model
 
 
+@lru_cache(maxsize=16)
+def _get_cached_gemini_model(model_name, kwargs_key):
+    """Return a shared model instance for a model name and hashable kwargs."""
+    return get_gemini_model(model_name=model_name, **dict(kwargs_key))
+
+
+def _get_shared_model(model_name, kwargs):
+    """Reuse a cached model across chat calls, building a fresh one for unhashable kwargs."""
+    kwargs_key = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwargs_key)
+    except TypeError:
+        return get_gemini_model(model_name=model_name, **kwargs)
+    return _get_cached_gemini_model(model_name, kwargs_key)
+
+
 def simple_chat(prompt, system_prompt=None, model_name="gemini-1.5-flash", **kwargs):
     """
     Simple chat interface - send a prompt and get a response
@@ -60,7 +78,9 @@ def simple_chat(prompt, system_prompt=None, model_name="gemini-1.5-flash", **kwa
     Returns:
         str: Model response content
     """
-    model = get_gemini_model(model_name=model_name, **kwargs)
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    model = _get_shared_model(model_name, kwargs)
 
     messages = []
     if system_prompt:
@@ -84,15 +104,16 @@ def batch_chat(prompts, system_prompt=None, model_name="gemini-1.5-flash", **kwa
     Returns:
         list: List of response contents
     """
-    model = get_gemini_model(model_name=model_name, **kwargs)
-
-    batch_messages = []
-    for prompt in prompts:
-        messages = []
-        if system_prompt:
-            messages.append(SystemMessage(content=system_prompt))
-        messages.append(HumanMessage(content=prompt))
-        batch_messages.append(messages)
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    model = _get_shared_model(model_name, kwargs)
+
+    # One SystemMessage shared by every prompt in the batch
+    if system_prompt:
+        system_message = SystemMessage(content=system_prompt)
+        batch_messages = [[system_message, HumanMessage(content=prompt)] for prompt in prompts]
+    else:
+        batch_messages = [[HumanMessage(content=prompt)] for prompt in prompts]
 
     responses = model.batch(batch_messages)
     return [response.content for response in responses]
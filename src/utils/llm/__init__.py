@@ -44,7 +44,14 @@ from .base import (
     LLMResponse,
     Message,
     RetryConfig,
+    clear_provider_cache,
     create_provider,
+    warm_providers,
+)
+from .cache import (
+    CacheBackend,
+    MemoryBackend,
+    SemanticLLMCache,
 )
 from .config import (
     Provider,
@@ -76,6 +83,8 @@ __all__ = [
     "RetryConfig",
     # Factory
     "create_provider",
+    "clear_provider_cache",
+    "warm_providers",
     # Config
     "Provider",
     "ModelConfig",
@@ -83,6 +92,10 @@ __all__ = [
     "get_default_model",
     "list_models",
     "MODEL_REGISTRY",
+    # Response cache
+    "CacheBackend",
+    "MemoryBackend",
+    "SemanticLLMCache",
     # Structured output
     "extract_json_from_text",
     "parse_to_model",
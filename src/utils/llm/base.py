@@ -5,23 +5,57 @@ Designed for LangChain 0.2.x+ compatibility with graceful degradation.
 Includes retry logic with exponential backoff for fault tolerance.
 """
 
+import asyncio
+import importlib
 import logging
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
-
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+try:
+    from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+except ImportError:
+    # Configs and response types stay usable; message conversion raises
+    AIMessage = BaseMessage = HumanMessage = SystemMessage = None
 from pydantic import BaseModel
 
+from .cache import CacheBackend, SemanticLLMCache, make_cache_key
 from .config import ModelConfig, Provider, get_model_config
-from .structured import StructuredOutputHandler, parse_to_model, create_json_prompt_suffix
+from .structured import StructuredOutputHandler
 
 T = TypeVar("T", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+# Default number of in-flight requests for batch() and abatch()
+BATCH_CONCURRENCY = 32
+
+# Message role -> LangChain message class (empty without langchain-core)
+_ROLE_MAP = {
+    "system": SystemMessage,
+    "human": HumanMessage,
+    "user": HumanMessage,
+    "assistant": AIMessage,
+    "ai": AIMessage,
+} if BaseMessage is not None else {}
+
+# Built-in exceptions classified the same way for every provider
+_BUILTIN_RETRYABLE_EXC: Dict[str, Tuple[Type[BaseException], ...]] = {
+    "timeout": (TimeoutError,),
+    "rate_limit": (),
+    "transient": (ConnectionError,),
+}
+
+# Provider class -> (retryable classes by category, whether the SDK declared any)
+_RETRYABLE_EXC_CACHE: Dict[type, Tuple[Dict[str, Tuple[Type[BaseException], ...]], bool]] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class RetryConfig:
     """Configuration for retry behavior."""
     max_retries: int = 3
@@ -42,24 +76,42 @@ class RetryConfig:
     retry_on_rate_limit: bool = True
     """Whether to retry on rate limit errors."""
 
+    delays: Tuple[float, ...] = field(init=False, repr=False)
+    """Exponential backoff ceiling per attempt, capped at max_delay."""
+
+    def __post_init__(self):
+        self.delays = tuple(
+            min(self.max_delay, self.initial_delay * self.exponential_base ** i)
+            for i in range(self.max_retries + 1)
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class LLMResponse:
     """Standardized response from LLM calls."""
     content: str
     input_tokens: int
     output_tokens: int
     model: str
-    raw_response: Any = None
+    raw_response: Any = field(default=None, repr=False)
     finish_reason: Optional[str] = None
     retry_count: int = 0
+    cache_hit: bool = False
+    cached_input_tokens: int = 0
+    """Input tokens served from the provider's prompt cache."""
+
+    cache_creation_tokens: int = 0
+    """Input tokens written to the provider's prompt cache."""
+
+    usage_estimated: bool = False
+    """Token counts were estimated from text length, not reported by the model."""
 
     @property
     def total_tokens(self) -> int:
         return self.input_tokens + self.output_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Simple message container for provider-agnostic use."""
     role: str  # "system", "human", "assistant"
@@ -67,16 +119,41 @@ class Message:
 
     def to_langchain(self):
         """Convert to LangChain message type."""
-        from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-
-        if self.role == "system":
-            return SystemMessage(content=self.content)
-        elif self.role == "human" or self.role == "user":
-            return HumanMessage(content=self.content)
-        elif self.role == "assistant" or self.role == "ai":
-            return AIMessage(content=self.content)
-        else:
+        try:
+            message_class = _ROLE_MAP[self.role]
+        except KeyError:
+            if not _ROLE_MAP:
+                raise ImportError(
+                    "langchain-core is required for message conversion. "
+                    "Install with: pip install langchain-core>=0.2.0"
+                )
             raise ValueError(f"Unknown role: {self.role}")
+        return message_class(content=self.content)
+
+
+def _http_status(error: BaseException) -> Optional[int]:
+    """Return the HTTP status code carried by an SDK error or its cause, if any."""
+    for exc in (error, error.__cause__):
+        for attr in ("status_code", "code"):
+            status = getattr(exc, attr, None)
+            if isinstance(status, int) and 100 <= status < 600:
+                return status
+    return None
+
+
+def _dict_to_langchain(msg: Dict) -> Any:
+    """Convert a {"role", "content"} dict to a LangChain message."""
+    return Message(
+        role=msg.get("role", "human"),
+        content=msg.get("content", "")
+    ).to_langchain()
+
+
+# Exact-type converters for _convert_messages; subclasses take the isinstance path
+_MESSAGE_CONVERTERS = {
+    Message: Message.to_langchain,
+    dict: _dict_to_langchain,
+}
 
 
 class BaseLLMProvider(ABC):
@@ -96,6 +173,8 @@ class BaseLLMProvider(ABC):
         temperature: float = 0.0,
         max_tokens: Optional[int] = None,
         retry_config: Optional[RetryConfig] = None,
+        cache: Optional[CacheBackend] = None,
+        semantic_cache: Optional[SemanticLLMCache] = None,
         **kwargs
     ):
         """
@@ -106,6 +185,8 @@ class BaseLLMProvider(ABC):
             temperature: Sampling temperature (0.0 = deterministic)
             max_tokens: Max output tokens (uses model default if None)
             retry_config: Configuration for retry behavior (uses defaults if None)
+            cache: Response cache consulted for temperature 0 calls (off if None)
+            semantic_cache: Similarity cache consulted by invoke() (off if None)
             **kwargs: Provider-specific arguments
         """
         self.config = get_model_config(model_name)
@@ -113,6 +194,11 @@ class BaseLLMProvider(ABC):
         self.temperature = temperature
         self.max_tokens = max_tokens or self.config.max_tokens
         self.retry_config = retry_config or RetryConfig()
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.stats = {"hits": 0, "misses": 0, "semantic_hits": 0}
+        # Token-usage readers by response type, for providers that probe shapes
+        self._extract_fn_cache: Dict[type, Callable[[Any], tuple]] = {}
 
         # Initialize the underlying LangChain model
         self._model = self._create_model(**kwargs)
@@ -132,32 +218,84 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    def _extract_cache_usage(self, response: Any) -> tuple:
+        """
+        Extract provider prompt-cache token counts from response.
+
+        Returns:
+            Tuple of (cached_input_tokens, cache_creation_tokens); zeros for
+            providers without prompt caching.
+        """
+        return 0, 0
+
     def _convert_messages(
         self,
         messages: Union[List[Message], List[Dict], List[Any]]
     ) -> List[Any]:
         """Convert messages to LangChain format."""
-        from langchain_core.messages import BaseMessage
-
-        result = []
-        for msg in messages:
-            if isinstance(msg, Message):
-                result.append(msg.to_langchain())
-            elif isinstance(msg, dict):
-                result.append(Message(
-                    role=msg.get("role", "human"),
-                    content=msg.get("content", "")
-                ).to_langchain())
-            elif isinstance(msg, BaseMessage):
-                result.append(msg)
-            else:
-                raise TypeError(f"Unsupported message type: {type(msg)}")
-        return result
+        get_converter = _MESSAGE_CONVERTERS.get
+        fallback = self._convert_message
+        return [get_converter(type(msg), fallback)(msg) for msg in messages]
+
+    def _convert_message(self, msg: Any) -> Any:
+        """Convert a message whose exact type has no entry in _MESSAGE_CONVERTERS."""
+        if BaseMessage is not None and isinstance(msg, BaseMessage):
+            return msg
+        if isinstance(msg, Message):
+            return msg.to_langchain()
+        if isinstance(msg, dict):
+            return _dict_to_langchain(msg)
+        raise TypeError(f"Unsupported message type: {type(msg)}")
+
+    @classmethod
+    def _load_retryable_exceptions(cls) -> Dict[str, Tuple[Type[BaseException], ...]]:
+        """
+        Return retryable exception classes by category.
+
+        Keys are "timeout", "rate_limit" and "transient". Providers fill
+        these with their SDK's exception classes, importing the SDK here so a
+        missing package does not break module import. Providers that declare
+        none have their errors classified by message instead.
+        """
+        return {"timeout": (), "rate_limit": (), "transient": ()}
+
+    def _retryable_categories(self) -> Tuple[Dict[str, Tuple[Type[BaseException], ...]], bool]:
+        """Return (classes by category incl. built-ins, whether SDK classes exist), per class."""
+        cached = _RETRYABLE_EXC_CACHE.get(type(self))
+        if cached is None:
+            declared = self._load_retryable_exceptions()
+            categories = {
+                name: _BUILTIN_RETRYABLE_EXC[name] + classes
+                for name, classes in declared.items()
+            }
+            cached = _RETRYABLE_EXC_CACHE[type(self)] = (categories, any(declared.values()))
+        return cached
 
     def _is_retryable_error(self, error: Exception) -> bool:
-        """Check if an error is retryable based on retry config."""
-        error_str = str(error).lower()
+        """Check if an error is retryable based on the current retry config."""
+        categories, declared = self._retryable_categories()
+
+        # Timeouts first: SDK timeout errors subclass their connection errors
+        if isinstance(error, categories["timeout"]):
+            return self.retry_config.retry_on_timeout
+        if isinstance(error, categories["rate_limit"]):
+            return self.retry_config.retry_on_rate_limit
+        if isinstance(error, categories["transient"]):
+            return True
 
+        # Generic SDK errors (e.g. google-genai ClientError) carry the HTTP status
+        status = _http_status(error)
+        if status == 429:
+            return self.retry_config.retry_on_rate_limit
+        if status is not None and status >= 500:
+            return True
+
+        if declared:
+            return False
+        return self._is_retryable_message(str(error).lower())
+
+    def _is_retryable_message(self, error_str: str) -> bool:
+        """Check a lowercased error message for retryable failure indicators."""
         # Timeout errors
         if self.retry_config.retry_on_timeout:
             timeout_indicators = ["timeout", "timed out", "deadline exceeded"]
@@ -177,12 +315,42 @@ class BaseLLMProvider(ABC):
 
         return False
 
-    def _calculate_delay(self, attempt: int) -> float:
-        """Calculate delay for retry attempt using exponential backoff."""
-        delay = self.retry_config.initial_delay * (
-            self.retry_config.exponential_base ** attempt
-        )
-        return min(delay, self.retry_config.max_delay)
+    def _calculate_delay(
+        self,
+        attempt: int,
+        error: Optional[Exception] = None,
+        prev_delay: Optional[float] = None,
+    ) -> float:
+        """
+        Calculate delay for a retry attempt.
+
+        Honors a Retry-After header on the error's HTTP response when present;
+        otherwise uses decorrelated jitter, drawing uniformly between the
+        initial delay and three times the previous delay so concurrent clients
+        do not retry in lockstep. Draws are capped by the next step of the
+        precomputed exponential schedule, so the first retry is jittered too.
+        """
+        retry_after = self._retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.retry_config.max_delay)
+
+        initial = self.retry_config.initial_delay
+        previous = initial if prev_delay is None else prev_delay
+        delays = self.retry_config.delays
+        upper = min(delays[min(attempt + 1, len(delays) - 1)], previous * 3)
+        return random.uniform(initial, max(initial, upper))
+
+    @staticmethod
+    def _retry_after(error: Optional[Exception]) -> Optional[float]:
+        """Return the Retry-After seconds from an error's HTTP response, if any."""
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if not headers:
+            return None
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return None
 
     def _invoke_with_retry(
         self,
@@ -196,6 +364,7 @@ class BaseLLMProvider(ABC):
             Tuple of (response, retry_count)
         """
         last_error = None
+        delay = None
 
         for attempt in range(self.retry_config.max_retries + 1):
             try:
@@ -213,7 +382,7 @@ class BaseLLMProvider(ABC):
                     logger.error(f"Non-retryable error: {e}")
                     raise
 
-                delay = self._calculate_delay(attempt)
+                delay = self._calculate_delay(attempt, error=e, prev_delay=delay)
                 logger.warning(
                     f"LLM call failed (attempt {attempt + 1}/{self.retry_config.max_retries + 1}), "
                     f"retrying in {delay:.1f}s: {e}"
@@ -223,6 +392,48 @@ class BaseLLMProvider(ABC):
         # Should not reach here, but just in case
         raise last_error
 
+    async def _ainvoke_with_retry(
+        self,
+        lc_messages: List[Any],
+        **kwargs
+    ) -> tuple:
+        """
+        Invoke the model asynchronously with retry logic.
+
+        Backoff waits with asyncio.sleep, so other coroutines keep running.
+
+        Returns:
+            Tuple of (response, retry_count)
+        """
+        last_error = None
+        delay = None
+
+        for attempt in range(self.retry_config.max_retries + 1):
+            try:
+                response = await self._model.ainvoke(lc_messages, **kwargs)
+                return response, attempt
+
+            except Exception as e:
+                last_error = e
+
+                if attempt >= self.retry_config.max_retries:
+                    logger.error(f"LLM call failed after {attempt + 1} attempts: {e}")
+                    raise
+
+                if not self._is_retryable_error(e):
+                    logger.error(f"Non-retryable error: {e}")
+                    raise
+
+                delay = self._calculate_delay(attempt, error=e, prev_delay=delay)
+                logger.warning(
+                    f"LLM call failed (attempt {attempt + 1}/{self.retry_config.max_retries + 1}), "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+        # Should not reach here, but just in case
+        raise last_error
+
     def invoke(
         self,
         messages: Union[List[Message], List[Dict], List[Any]],
@@ -241,19 +452,140 @@ class BaseLLMProvider(ABC):
             LLMResponse with content and token usage
         """
         lc_messages = self._convert_messages(messages)
+
+        cache_key = self._cache_key(lc_messages, kwargs)
+        cached = self._lookup_response(cache_key, lc_messages, kwargs)
+        if cached is not None:
+            return cached
+
         response, retry_count = self._invoke_with_retry(lc_messages, **kwargs)
+        return self._store_response(cache_key, lc_messages, kwargs, response, retry_count)
 
-        input_tokens, output_tokens = self._extract_token_usage(response)
+    async def ainvoke(
+        self,
+        messages: Union[List[Message], List[Dict], List[Any]],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Invoke the model asynchronously with messages.
 
-        return LLMResponse(
-            content=response.content,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            model=self.model_name,
-            raw_response=response,
+        Same caching and retry behavior as invoke(), but backoff does not
+        block the event loop.
+
+        Args:
+            messages: List of messages (Message objects, dicts, or LangChain messages)
+            **kwargs: Additional model arguments
+
+        Returns:
+            LLMResponse with content and token usage
+        """
+        lc_messages = self._convert_messages(messages)
+
+        cache_key = self._cache_key(lc_messages, kwargs)
+        cached = self._lookup_response(cache_key, lc_messages, kwargs)
+        if cached is not None:
+            return cached
+
+        response, retry_count = await self._ainvoke_with_retry(lc_messages, **kwargs)
+        return self._store_response(cache_key, lc_messages, kwargs, response, retry_count)
+
+    def _lookup_response(
+        self,
+        cache_key: Optional[str],
+        lc_messages: List[Any],
+        kwargs: Dict[str, Any],
+    ) -> Optional[LLMResponse]:
+        """Return a cached or semantically similar response, or None."""
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return self._as_cache_hit(cached)
+
+        # Like the exact cache, only deterministic calls reuse answers
+        if self.semantic_cache is not None and self.temperature == 0:
+            similar = self.semantic_cache.lookup(
+                self.model_name, self.max_tokens, lc_messages, kwargs
+            )
+            if similar is not None:
+                self.stats["semantic_hits"] += 1
+                return self._as_cache_hit(similar)
+        return None
+
+    def _store_response(
+        self,
+        cache_key: Optional[str],
+        lc_messages: List[Any],
+        kwargs: Dict[str, Any],
+        response: Any,
+        retry_count: int,
+    ) -> LLMResponse:
+        """Wrap a fresh model response and remember it in the configured caches."""
+        result = self._to_llm_response(
+            response,
             finish_reason=getattr(response, "response_metadata", {}).get("finish_reason"),
             retry_count=retry_count,
         )
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        if self.semantic_cache is not None and self.temperature == 0:
+            self.semantic_cache.store(
+                self.model_name, self.max_tokens, lc_messages, result, kwargs
+            )
+        return result
+
+    async def astream(
+        self,
+        messages: Union[List[Message], List[Dict], List[Any]],
+        **kwargs
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """
+        Stream the model's reply as it is generated.
+
+        Yields each chunk's content as it arrives, then a final LLMResponse
+        for the whole reply with its token usage. Failures before the first
+        chunk are retried like invoke(); once output has started, errors
+        propagate rather than replaying a partial reply.
+
+        Args:
+            messages: List of messages (Message objects, dicts, or LangChain messages)
+            **kwargs: Additional model arguments
+
+        Yields:
+            Content chunks (str), followed by one LLMResponse
+        """
+        lc_messages = self._convert_messages(messages)
+        delay = None
+
+        for attempt in range(self.retry_config.max_retries + 1):
+            aggregate = None
+            try:
+                async for chunk in self._model.astream(lc_messages, **kwargs):
+                    # Chunk addition merges content and usage metadata
+                    aggregate = chunk if aggregate is None else aggregate + chunk
+                    yield chunk.content
+                break
+
+            except Exception as e:
+                if (
+                    aggregate is not None
+                    or attempt >= self.retry_config.max_retries
+                    or not self._is_retryable_error(e)
+                ):
+                    raise
+
+                delay = self._calculate_delay(attempt, error=e, prev_delay=delay)
+                logger.warning(
+                    f"LLM stream failed to start (attempt {attempt + 1}/"
+                    f"{self.retry_config.max_retries + 1}), retrying in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+        if aggregate is None:
+            aggregate = AIMessage(content="")
+        yield self._to_llm_response(
+            aggregate,
+            finish_reason=aggregate.response_metadata.get("finish_reason"),
+            retry_count=attempt,
+        )
 
     def invoke_structured(
         self,
@@ -274,111 +606,277 @@ class BaseLLMProvider(ABC):
         """
         lc_messages = self._convert_messages(messages)
 
-        # Try LangChain's structured output first
-        handler = StructuredOutputHandler(self._model, output_class)
+        cache_key = self._cache_key(lc_messages, kwargs, output_class)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            parsed, response = cached
+            return parsed.model_copy(deep=True), self._as_cache_hit(response)
 
-        try:
-            parsed = handler.invoke(lc_messages, **kwargs)
-            # Get token usage from a regular call for tracking
-            # (structured output may not expose tokens directly)
-            response = self._model.invoke(lc_messages, **kwargs)
-            input_tokens, output_tokens = self._extract_token_usage(response)
+        result = self._invoke_structured_uncached(lc_messages, output_class, **kwargs)
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
 
-            return parsed, LLMResponse(
-                content=response.content,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                model=self.model_name,
-                raw_response=response,
+    def _invoke_structured_uncached(
+        self,
+        lc_messages: List[Any],
+        output_class: Type[T],
+        **kwargs
+    ) -> tuple:
+        """Run invoke_structured against the model, without the response cache."""
+        # The handler tries native structured output and falls back to a
+        # JSON prompt itself; token usage comes from the same call's raw message
+        handler = StructuredOutputHandler(self._model, output_class)
+        parsed, response = handler.invoke_with_raw(lc_messages, **kwargs)
+        if response is None:
+            # No raw message to read usage from; estimate (~4 chars per token)
+            # rather than report a billed call as free
+            content = parsed.model_dump_json()
+            logger.warning(
+                f"{self.model_name} returned no raw structured response; "
+                "estimating token usage"
             )
-        except Exception as e:
-            # Fallback: add JSON prompt and parse manually
-            suffix = create_json_prompt_suffix(output_class)
-            modified_messages = list(lc_messages)
-            if modified_messages:
-                from langchain_core.messages import HumanMessage
-                last = modified_messages[-1]
-                modified_messages[-1] = HumanMessage(
-                    content=last.content + suffix
-                )
-
-            response = self._model.invoke(modified_messages, **kwargs)
-            input_tokens, output_tokens = self._extract_token_usage(response)
-
-            parsed = parse_to_model(response.content, output_class)
-
             return parsed, LLMResponse(
-                content=response.content,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
+                content=content,
+                input_tokens=sum(len(str(m.content)) for m in lc_messages) // 4,
+                output_tokens=len(content) // 4,
                 model=self.model_name,
-                raw_response=response,
+                usage_estimated=True,
             )
+        return parsed, self._to_llm_response(response)
+
+    def _cache_key(
+        self,
+        lc_messages: List[Any],
+        kwargs: Dict[str, Any],
+        output_class: Optional[Type[BaseModel]] = None,
+    ) -> Optional[str]:
+        """Return the response-cache key for a deterministic call, or None if not cacheable."""
+        if self.cache is None or self.temperature != 0:
+            return None
+        extra = dict(kwargs)
+        if output_class is not None:
+            extra["output_class"] = f"{output_class.__module__}.{output_class.__qualname__}"
+        return make_cache_key(self.model_name, self.max_tokens, lc_messages, extra)
+
+    def _cache_lookup(self, cache_key: Optional[str]) -> Any:
+        """Fetch a cached result and update hit/miss stats."""
+        if cache_key is None:
+            return None
+        cached = self.cache.get(cache_key)
+        self.stats["hits" if cached is not None else "misses"] += 1
+        return cached
+
+    def _as_cache_hit(self, response: LLMResponse) -> LLMResponse:
+        """Copy a cached response with zero billed tokens and cache_hit set."""
+        return replace(
+            response,
+            input_tokens=0,
+            output_tokens=0,
+            retry_count=0,
+            cache_hit=True,
+        )
 
     def batch(
         self,
         message_batches: List[List[Union[Message, Dict, Any]]],
+        concurrency: int = BATCH_CONCURRENCY,
         **kwargs
     ) -> List[LLMResponse]:
         """
         Batch invoke the model with multiple message lists.
 
+        Requests run concurrently through the model's own batch(). Async
+        callers should use abatch(), which runs on their event loop.
+
         Args:
             message_batches: List of message lists
-            **kwargs: Additional model arguments
+            concurrency: Maximum requests in flight at once, unless the
+                caller's config sets max_concurrency
+            **kwargs: Additional model arguments, including a RunnableConfig
+                under "config"
 
         Returns:
-            List of LLMResponses
+            List of LLMResponses, in input order
         """
         lc_batches = [self._convert_messages(msgs) for msgs in message_batches]
-        responses = self._model.batch(lc_batches, **kwargs)
-
-        results = []
-        for response in responses:
-            input_tokens, output_tokens = self._extract_token_usage(response)
-            results.append(LLMResponse(
-                content=response.content,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                model=self.model_name,
-                raw_response=response,
-            ))
-        return results
+        config = dict(kwargs.pop("config", None) or {})
+        config.setdefault("max_concurrency", concurrency)
+        responses = self._model.batch(lc_batches, config=config, **kwargs)
+        return [self._to_llm_response(response) for response in responses]
+
+    async def abatch(
+        self,
+        message_batches: List[List[Union[Message, Dict, Any]]],
+        concurrency: int = BATCH_CONCURRENCY,
+        **kwargs
+    ) -> List[LLMResponse]:
+        """
+        Invoke the model on multiple message lists concurrently.
+
+        Each request goes through ainvoke(), so one request backing off after
+        a rate limit does not hold up the others.
+
+        Args:
+            message_batches: List of message lists
+            concurrency: Maximum requests in flight at once
+            **kwargs: Additional model arguments
+
+        Returns:
+            List of LLMResponses, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def invoke_one(messages: List[Any]) -> LLMResponse:
+            async with semaphore:
+                return await self.ainvoke(messages, **kwargs)
+
+        return list(await asyncio.gather(*(invoke_one(msgs) for msgs in message_batches)))
+
+    def _to_llm_response(self, response: Any, **fields) -> LLMResponse:
+        """Wrap a raw LangChain response with its token and prompt-cache usage."""
+        input_tokens, output_tokens = self._extract_token_usage(response)
+        cached_input_tokens, cache_creation_tokens = self._extract_cache_usage(response)
+        return LLMResponse(
+            content=response.content,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=self.model_name,
+            raw_response=response,
+            cached_input_tokens=cached_input_tokens,
+            cache_creation_tokens=cache_creation_tokens,
+            **fields,
+        )
 
     def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Estimate cost for given token counts."""
         return self.config.estimate_cost(input_tokens, output_tokens)
 
 
+# Opt-in process-level provider cache so repeated create_provider() calls can
+# reuse one underlying client (and its connection pool). Least recently used
+# first.
+PROVIDER_CACHE_MAX_SIZE = 32
+_PROVIDER_CACHE: "OrderedDict[tuple, BaseLLMProvider]" = OrderedDict()
+_PROVIDER_CACHE_LOCK = threading.Lock()
+
+
+def clear_provider_cache() -> None:
+    """Drop all cached provider instances."""
+    with _PROVIDER_CACHE_LOCK:
+        _PROVIDER_CACHE.clear()
+
+
 def create_provider(
     model_name: str,
     temperature: float = 0.0,
+    use_cache: bool = False,
     **kwargs
 ) -> BaseLLMProvider:
     """
     Factory function to create the appropriate provider for a model.
 
+    Each call returns a new provider unless use_cache is set. Cached
+    providers are shared per (model_name, temperature, kwargs), so only
+    callers that never mutate the provider (retry_config, cache, ...) should
+    opt in. Calls with unhashable kwargs are never cached.
+
     Args:
         model_name: Name of the model (from MODEL_REGISTRY)
         temperature: Sampling temperature
+        use_cache: Share one cached provider across identical calls
         **kwargs: Provider-specific arguments
 
     Returns:
         Configured LLM provider instance
     """
+    if not use_cache:
+        return _build_provider(model_name, temperature, **kwargs)
+
+    key = (model_name, temperature, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return _build_provider(model_name, temperature, **kwargs)
+
+    with _PROVIDER_CACHE_LOCK:
+        provider = _PROVIDER_CACHE.get(key)
+        if provider is not None:
+            _PROVIDER_CACHE.move_to_end(key)
+            return provider
+
+    provider = _build_provider(model_name, temperature, **kwargs)
+    with _PROVIDER_CACHE_LOCK:
+        # Keep the first instance if another thread built one concurrently
+        provider = _PROVIDER_CACHE.setdefault(key, provider)
+        _PROVIDER_CACHE.move_to_end(key)
+        while len(_PROVIDER_CACHE) > PROVIDER_CACHE_MAX_SIZE:
+            _PROVIDER_CACHE.popitem(last=False)
+    return provider
+
+
+def _build_provider(
+    model_name: str,
+    temperature: float,
+    **kwargs
+) -> BaseLLMProvider:
+    """Instantiate the provider class for a model."""
     config = get_model_config(model_name)
+    factory = PROVIDER_FACTORIES.get(config.provider) or _load_provider(config.provider)
+    return factory(model_name, temperature=temperature, **kwargs)
 
-    if config.provider == Provider.GEMINI:
-        from .providers.gemini import GeminiProvider
-        return GeminiProvider(model_name, temperature=temperature, **kwargs)
 
-    elif config.provider == Provider.ANTHROPIC:
-        from .providers.anthropic import AnthropicProvider
-        return AnthropicProvider(model_name, temperature=temperature, **kwargs)
+# Provider -> (provider module, class name, LangChain integration package)
+_PROVIDER_MODULES: Dict[Provider, Tuple[str, str, str]] = {
+    Provider.GEMINI: (".providers.gemini", "GeminiProvider", "langchain_google_genai"),
+    Provider.ANTHROPIC: (".providers.anthropic", "AnthropicProvider", "langchain_anthropic"),
+    Provider.OPENAI: (".providers.openai", "OpenAIProvider", "langchain_openai"),
+}
 
-    elif config.provider == Provider.OPENAI:
-        from .providers.openai import OpenAIProvider
-        return OpenAIProvider(model_name, temperature=temperature, **kwargs)
+# Provider -> provider class, filled as each provider module is loaded
+PROVIDER_FACTORIES: Dict[Provider, Type[BaseLLMProvider]] = {}
 
-    else:
-        raise ValueError(f"No provider implementation for: {config.provider}")
+
+@lru_cache(maxsize=None)
+def _load_provider(provider: Provider) -> Type[BaseLLMProvider]:
+    """Import a provider module, register its class, and return it."""
+    try:
+        module_name, class_name, _ = _PROVIDER_MODULES[provider]
+    except KeyError:
+        raise ValueError(f"No provider implementation for: {provider}")
+    module = importlib.import_module(module_name, package=__package__)
+    factory = PROVIDER_FACTORIES[provider] = getattr(module, class_name)
+    return factory
+
+
+def _warm_provider(provider: Provider) -> None:
+    """Load a provider and its LangChain integration, ignoring missing packages."""
+    _load_provider(provider)
+    integration = _PROVIDER_MODULES[provider][2]
+    try:
+        importlib.import_module(integration)
+    except ImportError:
+        logger.debug(f"Skipping warm-up of {integration}: not installed")
+
+
+def warm_providers(providers: List[Provider]) -> List[threading.Thread]:
+    """
+    Import provider modules in the background to overlap cold-start cost.
+
+    LangChain integration packages pull in large dependency trees, so the
+    first create_provider() call for a provider can be slow. Calling this at
+    startup moves that import onto daemon threads.
+
+    Args:
+        providers: Providers to load
+
+    Returns:
+        The started threads, for callers that want to join them
+    """
+    threads = [
+        threading.Thread(target=_warm_provider, args=(provider,), daemon=True)
+        for provider in providers
+    ]
+    for thread in threads:
+        thread.start()
+    return threads
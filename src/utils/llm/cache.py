@@ -0,0 +1,233 @@
+"""
+Response caches for LLM calls.
+
+The exact-match cache keys on hashes of the model, generation settings and
+message contents, so a repeated deterministic prompt is answered locally
+without a network round-trip or billing. The semantic cache additionally
+reuses answers for paraphrased final prompts by embedding similarity.
+"""
+
+import bisect
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+
+# Recent prompt embeddings kept so a lookup miss and its store embed once
+RECENT_EMBEDDINGS = 256
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached LLM responses."""
+
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    def set(self, key: str, value: Any) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+
+class MemoryBackend:
+    """In-process LRU cache with per-entry time-to-live."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a live cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries past maxsize."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def make_cache_key(
+    model_name: str,
+    max_tokens: int,
+    lc_messages: Sequence[Any],
+    extra: Optional[dict] = None,
+) -> str:
+    """Hash a request into a stable cache key."""
+    payload = {
+        "model": model_name,
+        "max_tokens": max_tokens,
+        "messages": [(msg.type, msg.content) for msg in lc_messages],
+        "extra": extra or {},
+    }
+    serialized = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class SemanticLLMCache:
+    """
+    Cache keyed by embedding similarity of the final human message.
+
+    Entries only match requests with the same model, settings and preceding
+    conversation, so answers never leak across conversations. Lookup is a
+    brute-force cosine search over unit-normalized float32 vectors, kept as
+    rows of a matrix that grows in place.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        threshold: float = 0.92,
+        ttl: float = 3600.0,
+        maxsize: int = 1024,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            embed: Function mapping text to an embedding vector
+            threshold: Minimum cosine similarity for a hit
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum entries kept; oldest are evicted first
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._contexts: List[str] = []
+        self._expires: List[float] = []
+        self._values: List[Any] = []
+        # Rows [:len(self._values)] hold the live entries' vectors
+        self._matrix: Optional[np.ndarray] = None
+        self._recent: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(
+        self,
+        model_name: str,
+        max_tokens: int,
+        lc_messages: Sequence[Any],
+        extra: Optional[dict] = None,
+    ) -> Optional[Any]:
+        """Return the stored value for the most similar prompt, or None below threshold."""
+        split = self._split(model_name, max_tokens, lc_messages, extra)
+        if split is None:
+            return None
+        context, text = split
+        query = self._unit_vector(text)
+
+        with self._lock:
+            now = time.monotonic()
+            candidates = [
+                i for i, entry_context in enumerate(self._contexts)
+                if entry_context == context and self._expires[i] >= now
+            ]
+            if not candidates:
+                return None
+            scores = self._matrix[candidates] @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            return self._values[candidates[best]]
+
+    def store(
+        self,
+        model_name: str,
+        max_tokens: int,
+        lc_messages: Sequence[Any],
+        value: Any,
+        extra: Optional[dict] = None,
+    ) -> None:
+        """Remember a value for this prompt; non-human final messages are ignored."""
+        split = self._split(model_name, max_tokens, lc_messages, extra)
+        if split is None:
+            return
+        context, text = split
+        vector = self._unit_vector(text)
+
+        with self._lock:
+            count = len(self._values)
+            if self._matrix is None:
+                self._matrix = np.empty((min(16, self.maxsize + 1), vector.size), np.float32)
+            elif count == len(self._matrix):
+                grown = np.empty((min(2 * count, self.maxsize + 1), vector.size), np.float32)
+                grown[:count] = self._matrix
+                self._matrix = grown
+            self._matrix[count] = vector
+            count += 1
+
+            now = time.monotonic()
+            self._contexts.append(context)
+            self._expires.append(now + self.ttl)
+            self._values.append(value)
+            # Entries share one ttl, so expired ones are a prefix, like the oldest
+            drop = max(bisect.bisect_left(self._expires, now), count - self.maxsize)
+            if drop > 0:
+                for entries in (self._contexts, self._expires, self._values):
+                    del entries[:drop]
+                self._matrix[:count - drop] = self._matrix[drop:count]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _split(
+        self,
+        model_name: str,
+        max_tokens: int,
+        lc_messages: Sequence[Any],
+        extra: Optional[dict],
+    ) -> Optional[Tuple[str, str]]:
+        """Return (context key, final prompt text), or None if the request is not cacheable."""
+        if not lc_messages:
+            return None
+        last = lc_messages[-1]
+        if last.type != "human" or not isinstance(last.content, str):
+            return None
+        context = make_cache_key(model_name, max_tokens, lc_messages[:-1], extra)
+        return context, last.content
+
+    def _unit_vector(self, text: str) -> np.ndarray:
+        """Embed text and normalize so dot products are cosine similarities."""
+        with self._lock:
+            vector = self._recent.get(text)
+            if vector is not None:
+                self._recent.move_to_end(text)
+                return vector
+
+        vector = np.asarray(self.embed(text), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm:
+            vector = vector / norm
+
+        with self._lock:
+            self._recent[text] = vector
+            while len(self._recent) > RECENT_EMBEDDINGS:
+                self._recent.popitem(last=False)
+        return vector
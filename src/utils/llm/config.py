@@ -5,7 +5,8 @@ Designed to support multiple providers with easy expansion.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 from enum import Enum
 
 
@@ -16,7 +17,7 @@ class Provider(Enum):
     OPENAI = "openai"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for a specific model."""
     provider: Provider
@@ -37,7 +38,7 @@ class ModelConfig:
 
 
 # Model registry - add new models here
-MODEL_REGISTRY: Dict[str, ModelConfig] = {
+_MODEL_REGISTRY: Dict[str, ModelConfig] = {
     # Gemini models
     "gemini-2.0-flash": ModelConfig(
         provider=Provider.GEMINI,
@@ -117,6 +118,11 @@ MODEL_REGISTRY: Dict[str, ModelConfig] = {
     ),
 }
 
+# Read-only view so callers cannot mutate the shared registry
+MODEL_REGISTRY: Mapping[str, ModelConfig] = MappingProxyType(_MODEL_REGISTRY)
+
+_AVAILABLE_MODELS_STR = ", ".join(sorted(MODEL_REGISTRY))
+
 
 # Default models per provider
 DEFAULT_MODELS: Dict[Provider, str] = {
@@ -128,10 +134,15 @@ DEFAULT_MODELS: Dict[Provider, str] = {
 
 def get_model_config(model_name: str) -> ModelConfig:
     """Get configuration for a model by name."""
-    if model_name not in MODEL_REGISTRY:
-        available = ", ".join(sorted(MODEL_REGISTRY.keys()))
-        raise ValueError(f"Unknown model: {model_name}. Available: {available}")
-    return MODEL_REGISTRY[model_name]
+    config = MODEL_REGISTRY.get(model_name)
+    if config is None:
+        raise ValueError(_format_unknown_model(model_name))
+    return config
+
+
+def _format_unknown_model(model_name: str) -> str:
+    """Build the error message for an unregistered model name."""
+    return f"Unknown model: {model_name}. Available: {_AVAILABLE_MODELS_STR}"
 
 
 def get_default_model(provider: Provider) -> str:
@@ -0,0 +1,62 @@
+"""
+Shared HTTP client for provider SDKs.
+
+One pooled httpx client per process keeps TCP/TLS connections alive across
+LLM calls instead of each provider instance opening its own pool.
+"""
+
+import atexit
+import threading
+from typing import Any, Optional
+
+
+POOL_LIMITS = {
+    "max_keepalive_connections": 20,
+    "max_connections": 100,
+    "keepalive_expiry": 30.0,
+}
+
+TIMEOUTS = {
+    "connect": 10.0,
+    "read": 120.0,
+    "write": 30.0,
+    "pool": 5.0,
+}
+
+_sync_client: Optional[Any] = None
+_client_lock = threading.Lock()
+
+
+def get_sync_client() -> Any:
+    """Return the process-wide httpx.Client, creating it on first use."""
+    global _sync_client
+    with _client_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            import httpx
+
+            _sync_client = httpx.Client(
+                limits=httpx.Limits(**POOL_LIMITS),
+                timeout=httpx.Timeout(**TIMEOUTS),
+            )
+        return _sync_client
+
+
+def close_clients() -> None:
+    """
+    Close the shared client; a later get_sync_client() builds a new one.
+
+    Cached providers hold the closed client, so the provider cache is
+    cleared too.
+    """
+    global _sync_client
+    # Imported here: provider modules import this one and base loads them
+    from .base import clear_provider_cache
+
+    with _client_lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+    clear_provider_cache()
+
+
+atexit.register(close_clients)
@@ -8,9 +8,12 @@ STATUS: Stub implementation - expand when needed.
 """
 
 import os
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
-from ..base import BaseLLMProvider
+from ..base import BaseLLMProvider, Message, SystemMessage
+
+# Marks a content block as a prompt-cache breakpoint
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
 
 
 class AnthropicProvider(BaseLLMProvider):
@@ -52,6 +55,40 @@ class AnthropicProvider(BaseLLMProvider):
 
         return ChatAnthropic(**model_kwargs)
 
+    @classmethod
+    def _load_retryable_exceptions(cls) -> Dict[str, Tuple[Type[BaseException], ...]]:
+        """Add anthropic SDK exceptions to the retryable categories."""
+        categories = super()._load_retryable_exceptions()
+        try:
+            import anthropic
+        except ImportError:
+            return categories
+
+        categories["timeout"] += (anthropic.APITimeoutError,)
+        categories["rate_limit"] += (anthropic.RateLimitError,)
+        categories["transient"] += (anthropic.APIConnectionError, anthropic.InternalServerError)
+        return categories
+
+    def _convert_messages(
+        self,
+        messages: Union[List[Message], List[Dict], List[Any]]
+    ) -> List[Any]:
+        """Convert messages, marking the last system prompt as a prompt-cache breakpoint."""
+        lc_messages = super()._convert_messages(messages)
+        for index in range(len(lc_messages) - 1, -1, -1):
+            message = lc_messages[index]
+            # Checked by type so a missing langchain-core (SystemMessage is
+            # None) cannot break isinstance on passed-through objects
+            if getattr(message, "type", None) == "system":
+                if isinstance(message.content, str) and message.content:
+                    lc_messages[index] = SystemMessage(content=[{
+                        "type": "text",
+                        "text": message.content,
+                        "cache_control": EPHEMERAL_CACHE_CONTROL,
+                    }])
+                break
+        return lc_messages
+
     def _extract_token_usage(self, response: Any) -> tuple:
         """Extract token counts from Claude response."""
         input_tokens = 0
@@ -72,6 +109,17 @@ class AnthropicProvider(BaseLLMProvider):
 
         return input_tokens, output_tokens
 
+    def _extract_cache_usage(self, response: Any) -> tuple:
+        """Extract prompt-cache read/creation token counts from Claude response."""
+        metadata = getattr(response, "response_metadata", None)
+        if isinstance(metadata, dict):
+            usage = metadata.get("usage") or {}
+            return (
+                usage.get("cache_read_input_tokens") or 0,
+                usage.get("cache_creation_input_tokens") or 0,
+            )
+        return 0, 0
+
 
 def get_anthropic_model(
     model_name: str = "claude-3-5-sonnet",
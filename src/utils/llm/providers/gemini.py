@@ -6,7 +6,7 @@ Compatible with: langchain-core>=0.2.0
 """
 
 import os
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from ..base import BaseLLMProvider
 
@@ -60,6 +60,39 @@ class GeminiProvider(BaseLLMProvider):
 
         return ChatGoogleGenerativeAI(**model_kwargs)
 
+    @classmethod
+    def _load_retryable_exceptions(cls) -> Dict[str, Tuple[Type[BaseException], ...]]:
+        """
+        Add Google SDK exceptions to the retryable categories.
+
+        Older langchain-google-genai releases raise google.api_core errors;
+        newer ones raise google-genai errors, whose 4xx ClientError covers
+        429s and is classified by its HTTP status code instead.
+        """
+        categories = super()._load_retryable_exceptions()
+        try:
+            import google.api_core.exceptions as google_exceptions
+        except ImportError:
+            pass
+        else:
+            categories["timeout"] += (google_exceptions.DeadlineExceeded,)
+            categories["rate_limit"] += (
+                google_exceptions.ResourceExhausted,
+                google_exceptions.TooManyRequests,
+            )
+            categories["transient"] += (
+                google_exceptions.ServiceUnavailable,
+                google_exceptions.InternalServerError,
+            )
+
+        try:
+            from google.genai import errors as genai_errors
+        except ImportError:
+            pass
+        else:
+            categories["transient"] += (genai_errors.ServerError,)
+        return categories
+
     def _extract_token_usage(self, response: Any) -> tuple:
         """
         Extract token counts from Gemini response.
@@ -67,42 +100,91 @@ class GeminiProvider(BaseLLMProvider):
         Token usage location varies by LangChain version:
         - 0.2.x: response.response_metadata.get("usage_metadata")
         - 1.0+: response.usage_metadata or response.response_metadata
-        """
-        input_tokens = 0
-        output_tokens = 0
 
-        # Try multiple locations for token counts
-        usage = None
+        The location found for a response type is remembered, so later
+        responses of that type skip the probe.
+        """
+        reader = self._extract_fn_cache.get(type(response))
+        if reader is not None:
+            try:
+                input_tokens, output_tokens = reader(response)
+            except (KeyError, AttributeError, TypeError):
+                pass
+            else:
+                if input_tokens or output_tokens:
+                    return input_tokens, output_tokens
+
+        return self._probe_token_usage(response)
+
+    def _probe_token_usage(self, response: Any) -> tuple:
+        """Search the known usage locations and cache a reader for the one found."""
+        get_usage = None
 
         # Method 1: Direct usage_metadata attribute (newer versions)
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            usage = response.usage_metadata
+        if getattr(response, "usage_metadata", None):
+            get_usage = _usage_metadata_attr
 
         # Method 2: response_metadata dict (common in 0.2.x+)
-        if not usage and hasattr(response, "response_metadata"):
+        elif isinstance(getattr(response, "response_metadata", None), dict):
             metadata = response.response_metadata
-            if isinstance(metadata, dict):
-                usage = metadata.get("usage_metadata") or metadata.get("usage")
-
-        # Extract from usage object/dict
-        if usage:
-            if isinstance(usage, dict):
-                input_tokens = usage.get("prompt_token_count", 0) or usage.get("input_tokens", 0)
-                output_tokens = usage.get("candidates_token_count", 0) or usage.get("output_tokens", 0)
-            elif hasattr(usage, "prompt_token_count"):
-                input_tokens = getattr(usage, "prompt_token_count", 0) or 0
-                output_tokens = getattr(usage, "candidates_token_count", 0) or 0
-            elif hasattr(usage, "input_tokens"):
-                input_tokens = getattr(usage, "input_tokens", 0) or 0
-                output_tokens = getattr(usage, "output_tokens", 0) or 0
-
-        # Fallback: estimate from content length
-        if input_tokens == 0 and output_tokens == 0:
-            # Rough estimate: ~4 chars per token
-            if hasattr(response, "content") and response.content:
-                output_tokens = len(response.content) // 4
-
-        return input_tokens, output_tokens
+            if metadata.get("usage_metadata"):
+                get_usage = _response_metadata_getter("usage_metadata")
+            elif metadata.get("usage"):
+                get_usage = _response_metadata_getter("usage")
+
+        if get_usage is not None:
+            reader = _make_usage_reader(get_usage, get_usage(response))
+            if reader is not None:
+                input_tokens, output_tokens = reader(response)
+                if input_tokens or output_tokens:
+                    self._extract_fn_cache[type(response)] = reader
+                    return input_tokens, output_tokens
+
+        # Fallback: estimate from content length (~4 chars per token)
+        if hasattr(response, "content") and response.content:
+            return 0, len(response.content) // 4
+        return 0, 0
+
+
+def _usage_metadata_attr(response: Any) -> Any:
+    """Return the usage_metadata attribute of a response."""
+    return response.usage_metadata
+
+
+def _response_metadata_getter(key: str) -> Callable[[Any], Any]:
+    """Return a function reading response.response_metadata[key]."""
+    def get_usage(response: Any) -> Any:
+        return response.response_metadata[key]
+    return get_usage
+
+
+def _make_usage_reader(
+    get_usage: Callable[[Any], Any],
+    usage: Any,
+) -> Optional[Callable[[Any], tuple]]:
+    """Build a (input, output) token reader for the field names this usage shape uses."""
+    if isinstance(usage, dict):
+        if "prompt_token_count" in usage:
+            input_key, output_key = "prompt_token_count", "candidates_token_count"
+        else:
+            input_key, output_key = "input_tokens", "output_tokens"
+
+        def read(response: Any) -> tuple:
+            found = get_usage(response)
+            return found.get(input_key, 0) or 0, found.get(output_key, 0) or 0
+        return read
+
+    if hasattr(usage, "prompt_token_count"):
+        input_attr, output_attr = "prompt_token_count", "candidates_token_count"
+    elif hasattr(usage, "input_tokens"):
+        input_attr, output_attr = "input_tokens", "output_tokens"
+    else:
+        return None
+
+    def read(response: Any) -> tuple:
+        found = get_usage(response)
+        return getattr(found, input_attr, 0) or 0, getattr(found, output_attr, 0) or 0
+    return read
 
 
 def get_gemini_model(
@@ -8,9 +8,10 @@ STATUS: Stub implementation - expand when needed.
 """
 
 import os
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple, Type
 
 from ..base import BaseLLMProvider
+from ..http_clients import get_sync_client
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -47,11 +48,27 @@ class OpenAIProvider(BaseLLMProvider):
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
             "api_key": api_key,
+            # Pooled keep-alive connections shared by all OpenAI providers
+            "http_client": get_sync_client(),
         }
         model_kwargs.update(kwargs)
 
         return ChatOpenAI(**model_kwargs)
 
+    @classmethod
+    def _load_retryable_exceptions(cls) -> Dict[str, Tuple[Type[BaseException], ...]]:
+        """Add openai SDK exceptions to the retryable categories."""
+        categories = super()._load_retryable_exceptions()
+        try:
+            import openai
+        except ImportError:
+            return categories
+
+        categories["timeout"] += (openai.APITimeoutError,)
+        categories["rate_limit"] += (openai.RateLimitError,)
+        categories["transient"] += (openai.APIConnectionError, openai.InternalServerError)
+        return categories
+
     def _extract_token_usage(self, response: Any) -> tuple:
         """Extract token counts from OpenAI response."""
         input_tokens = 0
@@ -7,9 +7,15 @@ is unavailable or behaves differently across LangChain versions.
 
 import json
 import re
-from typing import Any, Dict, Optional, Type, TypeVar, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
 from pydantic import BaseModel, ValidationError
 
+try:
+    from langchain_core.messages import HumanMessage
+except ImportError:
+    HumanMessage = None
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -112,11 +118,13 @@ def parse_to_model(
         return model_class.model_construct(**valid_fields)
 
 
+@lru_cache(maxsize=128)
 def create_json_prompt_suffix(model_class: Type[BaseModel]) -> str:
     """
     Create a prompt suffix that instructs the LLM to output valid JSON.
 
-    Includes the JSON schema for the expected output format.
+    Includes the JSON schema for the expected output format. Cached per
+    model class, since the suffix depends only on the class schema.
 
     Args:
         model_class: Pydantic model defining expected output
@@ -200,7 +208,8 @@ class StructuredOutputHandler:
             if hasattr(self.model, "with_structured_output"):
                 self._structured_model = self.model.with_structured_output(
                     self.output_class,
-                    method="json_mode"  # More widely supported than function calling
+                    method="json_mode",  # More widely supported than function calling
+                    include_raw=True,  # Keep the AIMessage so callers can read token usage
                 )
         except (TypeError, NotImplementedError, AttributeError):
             # Fall back to manual parsing
@@ -220,16 +229,26 @@ class StructuredOutputHandler:
         Returns:
             Validated Pydantic model instance
         """
+        parsed, _ = self.invoke_with_raw(messages, **kwargs)
+        return parsed
+
+    def invoke_with_raw(self, messages: list, **kwargs) -> Tuple[T, Any]:
+        """
+        Invoke model once and return structured output with the raw response.
+
+        Args:
+            messages: List of LangChain message objects
+            **kwargs: Additional arguments for model.invoke()
+
+        Returns:
+            Tuple of (validated Pydantic model instance, raw AIMessage or None
+            if the model did not expose one)
+        """
         if self._structured_model and not self._use_fallback:
             try:
-                result = self._structured_model.invoke(messages, **kwargs)
-                # Some versions return the model directly, others return AIMessage
-                if isinstance(result, self.output_class):
-                    return result
-                elif hasattr(result, "content"):
-                    return parse_to_model(result.content, self.output_class)
-                else:
-                    return parse_to_model(str(result), self.output_class)
+                return self._parse_structured_result(
+                    self._structured_model.invoke(messages, **kwargs)
+                )
             except Exception:
                 # If structured output fails, fall back to manual parsing
                 self._use_fallback = True
@@ -242,10 +261,29 @@ class StructuredOutputHandler:
             if hasattr(last_msg, "content"):
                 suffix = create_json_prompt_suffix(self.output_class)
                 # Create new message with modified content
-                from langchain_core.messages import HumanMessage
                 modified_messages[-1] = HumanMessage(
                     content=last_msg.content + suffix
                 )
 
         response = self.model.invoke(modified_messages, **kwargs)
-        return parse_to_model(response.content, self.output_class)
+        return parse_to_model(response.content, self.output_class), response
+
+    def _parse_structured_result(self, result: Any) -> Tuple[T, Any]:
+        """Split a with_structured_output() result into (parsed model, raw message)."""
+        # include_raw=True returns {"raw": AIMessage, "parsed": ..., "parsing_error": ...}
+        if isinstance(result, dict) and "raw" in result:
+            raw = result["raw"]
+            parsed = result.get("parsed")
+            if isinstance(parsed, self.output_class):
+                return parsed, raw
+            if isinstance(parsed, dict) and result.get("parsing_error") is None:
+                return self.output_class.model_validate(parsed), raw
+            return parse_to_model(raw.content, self.output_class), raw
+
+        # Some versions return the model directly, others return AIMessage
+        if isinstance(result, self.output_class):
+            return result, None
+        elif hasattr(result, "content"):
+            return parse_to_model(result.content, self.output_class), result
+        else:
+            return parse_to_model(str(result), self.output_class), None
@@ -0,0 +1,53 @@
+"""
+Tests for Pipeline soldier sampling helpers.
+"""
+
+from pathlib import Path
+
+from src.synthetic.pipeline import Pipeline
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CONFIG_DIR = PROJECT_ROOT / "config"
+
+
+def _make_pipeline(seed: int = 5) -> Pipeline:
+    pipeline = Pipeline(
+        style_spec_path=(
+            PROJECT_ROOT / "docs" / "components" / "synthetic_data_generation"
+            / "synthetic_style_spec_v4.1.yaml"
+        ),
+        themes_path=CONFIG_DIR / "synthetic" / "synthetic_themes.json",
+        vocabulary_path=CONFIG_DIR / "synthetic" / "synthetic_vocabulary.json",
+        hierarchy_path=CONFIG_DIR / "hierarchies" / "hierarchy_reference.json",
+        random_seed=seed,
+    )
+    pipeline._generate_soldiers(300)
+    return pipeline
+
+
+def test_group_soldiers_by_branch_keeps_order_and_anchor_state():
+    pipeline = _make_pipeline()
+    soldiers = list(pipeline.soldiers.values())
+
+    by_branch = pipeline._group_soldiers_by_branch(soldiers, 2)
+
+    assert sum(len(group) for group in by_branch.values()) == len(soldiers)
+    for branch, group in by_branch.items():
+        assert group == [
+            s for s in soldiers
+            if pipeline._select_state_for_source(s, 2).branch == branch
+        ]
+
+
+def test_sample_soldiers_for_source_with_index_matches_scan():
+    indexed = _make_pipeline(seed=9)
+    scanned = _make_pipeline(seed=9)
+    soldiers = list(indexed.soldiers.values())
+    by_branch = indexed._group_soldiers_by_branch(soldiers, 1)
+
+    first = indexed._sample_soldiers_for_source(soldiers, 40, 1, by_branch)
+    second = scanned._sample_soldiers_for_source(list(scanned.soldiers.values()), 40, 1)
+
+    assert [s.soldier_id for s in first] == [s.soldier_id for s in second]
+    assert len({s.soldier_id for s in first}) == 40
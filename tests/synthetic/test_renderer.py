@@ -0,0 +1,61 @@
+"""
+Tests for Renderer imperfection helpers.
+"""
+
+from types import SimpleNamespace
+
+from src.synthetic.hierarchy_loader import HierarchyLoader
+from src.synthetic.models import NameFormat
+from src.synthetic.renderer import Renderer
+
+
+class _FixedRng:
+    """Minimal rng stub returning a fixed op and index."""
+
+    def __init__(self, op: str, idx: int):
+        self.op = op
+        self.idx = idx
+
+    def choice(self, seq):
+        return self.op if self.op in seq else seq[0]
+
+    def randint(self, a, b):
+        return self.idx
+
+
+def _make_renderer(op: str, idx: int) -> Renderer:
+    renderer = Renderer(HierarchyLoader())
+    renderer.rng = _FixedRng(op, idx)
+    return renderer
+
+
+def test_inject_typo_double_repeats_character():
+    renderer = _make_renderer("double", 1)
+
+    assert renderer._inject_typo("Sallow") == "Saallow"
+
+
+def test_inject_typo_substitute_prefers_ocr_substitutions():
+    renderer = _make_renderer("substitute", 0)
+
+    assert renderer._inject_typo("Sallow") == "Sa1low"
+
+
+def test_inject_typo_omit_and_transpose():
+    assert _make_renderer("omit", 0)._inject_typo("Sallow") == "allow"
+    assert _make_renderer("transpose", 0)._inject_typo("Sallow") == "aSllow"
+
+
+def test_apply_column_bleed_merges_first_inner_space():
+    renderer = _make_renderer("omit", 0)
+
+    assert renderer._apply_column_bleed("Lt Sallow, 3rd") == "LtSallow, 3rd"
+    assert renderer._apply_column_bleed("a, b") == "a, b"
+
+
+def test_render_name_keeps_unknown_placeholders_and_braces():
+    renderer = Renderer(HierarchyLoader(), random_seed=1)
+    soldier = SimpleNamespace(name_last="Hale", name_first="Ada", name_middle=None)
+    clerk = SimpleNamespace(name_format=NameFormat(template="{LAST}, {FI}. {SUFFIX} {"))
+
+    assert renderer.render_name(soldier, clerk) == "Hale, A {SUFFIX} {"
@@ -0,0 +1,92 @@
+"""
+Tests for SituationManager lookups and assignment.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.synthetic.situation_manager import SituationManager
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+THEMES_PATH = PROJECT_ROOT / "config" / "synthetic" / "synthetic_themes.json"
+VOCABULARY_PATH = PROJECT_ROOT / "config" / "synthetic" / "synthetic_vocabulary.json"
+
+
+def _make_manager(seed: int = 7) -> SituationManager:
+    return SituationManager(
+        themes_path=THEMES_PATH,
+        vocabulary_path=VOCABULARY_PATH,
+        random_seed=seed,
+    )
+
+
+def test_situations_by_branch_matches_themes():
+    manager = _make_manager()
+
+    for branch, theme in manager.branch_themes.items():
+        assert manager.situations_by_branch[branch] == theme["situations"]
+
+
+def test_assign_situation_stays_within_branch():
+    manager = _make_manager()
+
+    for _ in range(50):
+        situation = manager.assign_situation("defense_command")
+        assert situation.branch == "defense_command"
+
+
+def test_assign_situation_unknown_branch_raises():
+    manager = _make_manager()
+
+    with pytest.raises(ValueError):
+        manager.assign_situation("unknown_branch")
+
+
+def test_resolve_vocabulary_merges_prefix_matches():
+    manager = SituationManager()
+    manager.situational_terms = {
+        "defense_patrol": ["b", "a"],
+        "defense_garrison": ["a", "c"],
+        "colonial_founding": ["x"],
+        "defensive": ["d"],
+    }
+    manager._sorted_term_keys = sorted(manager.situational_terms)
+
+    assert manager._resolve_vocabulary("defense_*") == ["a", "b", "c"]
+    assert manager._resolve_vocabulary("defens*") == ["a", "b", "c", "d"]
+    assert manager._resolve_vocabulary("colonial_founding") == ["x"]
+    assert manager._resolve_vocabulary("missing_*") == []
+
+
+def test_build_situations_shares_pool_per_pattern():
+    manager = SituationManager()
+    manager.situational_terms = {"defense_patrol": ["a"], "colonial_founding": ["x"]}
+    manager._sorted_term_keys = sorted(manager.situational_terms)
+    manager.branch_themes = {
+        "defense_command": {"situations": ["s1"], "vocabulary_pool": "defense_*"},
+        "expeditionary_corps": {"situations": ["s2"], "vocabulary_pool": "defense_*"},
+        "colonial_administration": {"situations": ["s3"], "vocabulary_pool": "colonial_*"},
+    }
+
+    manager._build_situations()
+
+    assert manager.situations["s1"].vocabulary_pool is manager.situations["s2"].vocabulary_pool
+    assert manager.situations["s3"].vocabulary_pool.primary == ["x"]
+
+
+def test_assign_situation_reproducible_with_injected_rng():
+    first = SituationManager(
+        themes_path=THEMES_PATH,
+        vocabulary_path=VOCABULARY_PATH,
+        rng=np.random.default_rng(5),
+    )
+    second = _make_manager(seed=5)
+
+    first_ids = [first.assign_situation("resource_directorate").situation_id for _ in range(30)]
+    second_ids = [second.assign_situation("resource_directorate").situation_id for _ in range(30)]
+
+    assert first_ids == second_ids
+    assert all(isinstance(sid, str) for sid in first_ids)
@@ -0,0 +1,136 @@
+"""
+Tests for SoldierFactory soldier and state generation.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from src.synthetic.hierarchy_loader import HierarchyLoader
+from src.synthetic.models import Branch, TransferScope
+from src.synthetic.soldier_factory import (
+    FIRST_NAMES,
+    LAST_NAMES,
+    MIDDLE_INITIALS,
+    RANKS,
+    STATE_COUNT_CUM_WEIGHTS,
+    TRANSFER_SCOPE_CUM_WEIGHTS,
+    TRANSFER_SCOPES,
+    SoldierFactory,
+)
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+HIERARCHY_PATH = PROJECT_ROOT / "config" / "hierarchies" / "hierarchy_reference.json"
+
+
+def _make_factory(seed: int = 11) -> SoldierFactory:
+    hierarchy = HierarchyLoader(config_path=HIERARCHY_PATH)
+    return SoldierFactory(hierarchy, np.random.default_rng(seed))
+
+
+def test_create_soldiers_returns_one_soldier_per_id():
+    factory = _make_factory()
+    soldier_ids = [f"S{i:04d}" for i in range(200)]
+
+    soldiers = factory.create_soldiers(soldier_ids)
+
+    assert [s.soldier_id for s in soldiers] == soldier_ids
+    rank_names = {name for name, _ in RANKS}
+    for soldier in soldiers:
+        assert soldier.name_first in FIRST_NAMES
+        assert soldier.name_last in LAST_NAMES
+        assert soldier.name_middle == "" or soldier.name_middle in MIDDLE_INITIALS
+        assert soldier.rank in rank_names
+        assert isinstance(soldier.rank, str)
+        assert 1 <= len(soldier.states) <= 3
+
+
+def test_create_soldiers_builds_consistent_states():
+    factory = _make_factory()
+    hierarchy = factory.hierarchy
+
+    for soldier in factory.create_soldiers([f"S{i:04d}" for i in range(200)]):
+        for order, state in enumerate(soldier.states, start=1):
+            assert state.state_id == f"{soldier.soldier_id}-{order}"
+            assert state.state_order == order
+            levels = hierarchy.get_branch_levels(state.branch)
+            assert state.post_path == "/".join(state.post_levels[lvl] for lvl in levels)
+            assert state.collision_zone_flag == bool(
+                state.collision_severity.value != "none"
+            )
+
+
+def test_create_soldiers_is_reproducible_for_seed():
+    ids = [f"S{i:04d}" for i in range(50)]
+
+    first = _make_factory(seed=3).create_soldiers(ids)
+    second = _make_factory(seed=3).create_soldiers(ids)
+
+    assert first == second
+
+
+def test_generate_rank_follows_rank_weights():
+    factory = _make_factory()
+    draws = [factory._generate_rank() for _ in range(5000)]
+
+    rank_names = [name for name, _ in RANKS]
+    assert set(draws) <= set(rank_names)
+    assert draws.count("Spec-1") > draws.count("Chief")
+
+
+def test_generate_posts_fills_every_level_from_hierarchy():
+    factory = _make_factory()
+    branch = Branch.DEFENSE_COMMAND
+    levels = factory.hierarchy.get_branch_levels(branch)
+
+    posts = factory._generate_posts(branch, 25)
+
+    assert len(posts) == 25
+    for post in posts:
+        assert list(post) == levels
+        for level, value in post.items():
+            assert value in factory.hierarchy.get_level_values(branch, level)
+    assert factory._generate_posts(branch, 0) == []
+
+
+def test_create_state_shares_post_levels_for_identical_posts():
+    factory = _make_factory()
+    post_levels = factory._generate_post(Branch.DEFENSE_COMMAND)
+
+    first = factory._create_state("S0001", 1, Branch.DEFENSE_COMMAND, dict(post_levels))
+    second = factory._create_state("S0002", 1, Branch.DEFENSE_COMMAND, dict(post_levels))
+
+    assert first.post_levels is second.post_levels
+    assert first.post_path == second.post_path
+    assert first.colliding_paths == second.colliding_paths
+    assert first.colliding_paths is not second.colliding_paths
+
+
+def test_generate_states_uses_given_transfer_scopes():
+    factory = _make_factory()
+    post_levels = factory._generate_post(Branch.COLONIAL_ADMINISTRATION)
+
+    states = factory._generate_states(
+        "S0001",
+        2,
+        Branch.COLONIAL_ADMINISTRATION,
+        post_levels,
+        [TransferScope.CROSS_BRANCH],
+    )
+
+    assert [s.state_order for s in states] == [1, 2]
+    assert states[1].branch != Branch.COLONIAL_ADMINISTRATION
+
+
+def test_cumulative_weight_tables_are_normalized():
+    assert STATE_COUNT_CUM_WEIGHTS[-1] == 1.0
+    assert TRANSFER_SCOPE_CUM_WEIGHTS[-1] == 1.0
+    assert np.all(np.diff(TRANSFER_SCOPE_CUM_WEIGHTS) > 0)
+
+
+def test_sample_transfer_scopes_follows_scope_weights():
+    scopes = _make_factory()._sample_transfer_scopes(20000)
+
+    shares = [scopes.count(scope) / len(scopes) for scope in TRANSFER_SCOPES]
+    assert np.allclose(shares, [0.20, 0.30, 0.35, 0.15], atol=0.02)
@@ -0,0 +1,68 @@
+"""
+Tests for SourceGenerator tier, archetype, and anchor sampling.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from src.synthetic.clerk_factory import ClerkFactory
+from src.synthetic.models import Branch
+from src.synthetic.situation_manager import SituationManager
+from src.synthetic.source_generator import QUALITY_TIERS, SourceGenerator
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+STYLE_SPEC_PATH = (
+    PROJECT_ROOT / "docs" / "components" / "synthetic_data_generation"
+    / "synthetic_style_spec_v4.1.yaml"
+)
+THEMES_PATH = PROJECT_ROOT / "config" / "synthetic" / "synthetic_themes.json"
+VOCABULARY_PATH = PROJECT_ROOT / "config" / "synthetic" / "synthetic_vocabulary.json"
+
+
+def _make_generator(seed: int = 7, rng=None) -> SourceGenerator:
+    return SourceGenerator(
+        clerk_factory=ClerkFactory(style_spec_path=STYLE_SPEC_PATH, random_seed=seed),
+        situation_manager=SituationManager(
+            themes_path=THEMES_PATH,
+            vocabulary_path=VOCABULARY_PATH,
+            random_seed=seed,
+        ),
+        random_seed=seed,
+        rng=rng,
+    )
+
+
+def test_create_source_draws_valid_fields():
+    generator = _make_generator()
+
+    for _ in range(50):
+        source = generator.create_source(Branch.DEFENSE_COMMAND, home_unit="unit")
+        clerk = generator.clerk_factory.get_clerk(source.clerk_id)
+        assert source.quality_tier in QUALITY_TIERS
+        assert source.temporal_anchor in (1, 2, 3)
+        assert isinstance(source.temporal_anchor, int)
+        assert clerk.archetype_id in generator.clerk_factory.archetypes
+
+
+def test_archetype_pools_are_cached_per_tier_and_branch():
+    generator = _make_generator()
+
+    first = generator._get_archetype_pools(4, Branch.EXPEDITIONARY_CORPS)
+    second = generator._get_archetype_pools(4, Branch.EXPEDITIONARY_CORPS)
+
+    biased, allowed = first
+    assert first is second
+    assert set(biased) <= set(generator.clerk_factory.archetypes)
+    assert not allowed or set(biased) <= set(allowed)
+
+
+def test_create_source_reproducible_with_injected_rng():
+    first = _make_generator(seed=3, rng=np.random.default_rng(3))
+    second = _make_generator(seed=3)
+
+    first_sources = [first.create_source(Branch.RESOURCE_DIRECTORATE, "unit") for _ in range(20)]
+    second_sources = [second.create_source(Branch.RESOURCE_DIRECTORATE, "unit") for _ in range(20)]
+
+    assert first_sources == second_sources
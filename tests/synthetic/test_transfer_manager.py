@@ -0,0 +1,62 @@
+"""
+Tests for TransferManager level sampling and transfers.
+"""
+
+import numpy as np
+
+from src.synthetic.hierarchy_loader import HierarchyLoader
+from src.synthetic.models import Branch
+from src.synthetic.transfer_manager import TransferManager
+
+
+def _make_manager(seed: int = 13) -> TransferManager:
+    loader = HierarchyLoader()
+    loader.branches = {
+        Branch.DEFENSE_COMMAND.value: {
+            "depth": 3,
+            "levels": ["sector", "fleet", "squadron"],
+            "level_config": {
+                "sector": {"values": ["Alpha", "Beta"]},
+                "fleet": {"values": ["1", "2", "3", "4"]},
+                "squadron": {"values": ["A"]},
+            },
+        }
+    }
+    return TransferManager(loader, np.random.default_rng(seed))
+
+
+def test_sample_level_value_excludes_current_value():
+    manager = _make_manager()
+
+    draws = {
+        manager._sample_level_value(Branch.DEFENSE_COMMAND, "fleet", exclude="2")
+        for _ in range(200)
+    }
+
+    assert draws == {"1", "3", "4"}
+
+
+def test_sample_level_value_keeps_exclude_when_only_option():
+    manager = _make_manager()
+
+    assert manager._sample_level_value(Branch.DEFENSE_COMMAND, "squadron", exclude="A") == "A"
+
+
+def test_generate_post_covers_every_level_value():
+    manager = _make_manager()
+
+    posts = [manager._generate_post(Branch.DEFENSE_COMMAND) for _ in range(200)]
+
+    assert {tuple(post) for post in posts} == {("sector", "fleet", "squadron")}
+    assert {post["sector"] for post in posts} == {"Alpha", "Beta"}
+    assert {post["fleet"] for post in posts} == {"1", "2", "3", "4"}
+    assert {post["squadron"] for post in posts} == {"A"}
+
+
+def test_next_uniform_refills_pool_in_blocks():
+    manager = _make_manager()
+
+    draws = [manager._next_uniform() for _ in range(5000)]
+
+    assert all(0.0 <= draw < 1.0 for draw in draws)
+    assert len(manager._uniform_pool) == 2 * 4096 - 5000
@@ -0,0 +1,82 @@
+"""
+Tests for VocabularyInjector layer rates and term sampling.
+"""
+
+from pathlib import Path
+
+from src.synthetic.clerk_factory import ClerkFactory
+from src.synthetic.models import Situation, VocabularyPool
+from src.synthetic.vocabulary_injector import (
+    CLUTTER_RATES,
+    SITUATIONAL_DENSITY,
+    VocabularyInjector,
+)
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+STYLE_SPEC_PATH = (
+    PROJECT_ROOT / "docs" / "components" / "synthetic_data_generation"
+    / "synthetic_style_spec_v4.1.yaml"
+)
+VOCABULARY_PATH = PROJECT_ROOT / "config" / "synthetic" / "synthetic_vocabulary.json"
+
+
+def _make_clerk(archetype_id: str = "field_medevac"):
+    return ClerkFactory(style_spec_path=STYLE_SPEC_PATH, random_seed=1).create_clerk(archetype_id)
+
+
+def test_clerk_profile_follows_density_and_archetype():
+    injector = VocabularyInjector(vocabulary_path=VOCABULARY_PATH, random_seed=1)
+    clerk = _make_clerk()
+
+    assert injector._get_clerk_profile(clerk) == (
+        SITUATIONAL_DENSITY[clerk.vocabulary_density],
+        CLUTTER_RATES["field_medevac"],
+        tuple(injector.clutter_terms["medical"]),
+    )
+    assert injector._get_clerk_profile(clerk) is injector._get_clerk_profile(clerk)
+
+
+def test_inject_vocabulary_appends_reported_terms():
+    injector = VocabularyInjector(vocabulary_path=VOCABULARY_PATH, random_seed=3)
+    clerk = _make_clerk()
+    situation = Situation(
+        situation_id="test_situation",
+        description="",
+        vocabulary_pool=VocabularyPool(primary=["evac-hold"]),
+    )
+
+    for _ in range(100):
+        text, injected = injector.inject_vocabulary("Lt Hale", clerk, situation)
+        terms = injected["situational"] + injected["clutter"] + injected["confounder"]
+        assert text.startswith("Lt Hale")
+        assert text.split() == ["Lt", "Hale"] + [
+            token for term in terms for token in term.split()
+        ]
+        assert injected["situational"] in ([], ["evac-hold"])
+
+
+def test_clerk_profile_not_shared_between_clerks_with_same_id():
+    injector = VocabularyInjector(vocabulary_path=VOCABULARY_PATH, random_seed=1)
+    formal = _make_clerk("sector_formal")
+    shuttle = _make_clerk("transport_shuttle")
+    assert formal.clerk_id == shuttle.clerk_id
+
+    injector._get_clerk_profile(formal)
+
+    assert injector._get_clerk_profile(shuttle)[1:] == (
+        CLUTTER_RATES["transport_shuttle"],
+        tuple(injector.clutter_terms["transport"]),
+    )
+
+
+def test_situational_terms_follow_each_situation_pool():
+    injector = VocabularyInjector(vocabulary_path=VOCABULARY_PATH, random_seed=1)
+
+    for term in ("alpha", "bravo"):
+        situation = Situation(
+            situation_id="shared_id",
+            description="",
+            vocabulary_pool=VocabularyPool(primary=[term]),
+        )
+        assert injector._sample_situational(situation) == term
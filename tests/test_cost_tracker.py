@@ -0,0 +1,212 @@
+"""
+Tests for CostTracker logging and cost accounting.
+"""
+
+import gc
+import json
+import threading
+import time
+
+import pytest
+
+from src.utils.cost_tracker import (
+    CostTracker,
+    MockCostTracker,
+    get_pricing,
+    _write_json_report,
+)
+
+
+def test_log_written_through_persistent_handle(tmp_path):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    tracker.start_phase("phase1")
+    tracker.record_api_call("phase1", 1000, 200, prompt_preview="line one\nline two")
+    tracker.record_event("checkpoint", "details here")
+    tracker.end_phase("phase1")
+    tracker.finalize()
+
+    assert not tracker._writer.is_alive()
+    log = tracker.log_file.read_text()
+    assert log.startswith("=" * 80 + "\nRESOLVER GENERATION LOG\n")
+    assert "PHASE START: phase1" in log
+    assert "API CALL #1 (phase1)" in log
+    assert "  Prompt: line one line two...\n" in log
+    assert "checkpoint\n  details here\n" in log
+    assert "EXECUTION SUMMARY" in log
+
+    report = json.loads(tracker.cost_file.read_text())
+    assert report["totals"]["api_calls"] == 1
+    assert report["phases"]["phase1"]["input_tokens"] == 1000
+
+
+def test_close_is_idempotent(tmp_path):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    tracker.record_event("only event")
+    tracker.close()
+    tracker.close()
+
+    assert tracker.log_file.read_text().endswith("only event\n")
+
+
+def test_concurrent_api_calls_all_logged(tmp_path):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    tracker.start_phase("phase1")
+
+    def worker():
+        for _ in range(50):
+            tracker.record_api_call("phase1", 10, 5)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    tracker.finalize()
+
+    log = tracker.log_file.read_text()
+    assert tracker.api_calls == 200
+    assert tracker.phases["phase1"]["input_tokens"] == 2000
+    for n in range(1, 201):
+        assert f"] API CALL #{n} (phase1)\n" in log
+
+
+def test_pricing_is_loaded_once():
+    from src.utils import cost_tracker
+
+    assert get_pricing() is get_pricing()
+    assert cost_tracker.PRICING is get_pricing()
+
+
+def test_calculate_cost_uses_model_pricing(tmp_path):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    unknown = CostTracker("task", "unknown-model", log_dir=str(tmp_path))
+    pricing = get_pricing()["gemini-2.5-pro"]
+
+    expected = 2.0 * pricing["input"] + 0.5 * pricing["output"]
+    assert tracker._calculate_cost(2_000_000, 500_000) == pytest.approx(expected)
+    assert unknown._calculate_cost(2_000_000, 500_000) == 0
+    tracker.close()
+    unknown.close()
+
+
+def test_timestamp_reused_within_same_second(tmp_path, monkeypatch):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    now = 1_700_000_000
+    monkeypatch.setattr("src.utils.cost_tracker.time.time", lambda: now + 0.25)
+
+    first = tracker._timestamp()
+    assert first == time.strftime("%H:%M:%S", time.localtime(now))
+    assert tracker._timestamp() is first
+
+    now += 1
+    assert tracker._timestamp() == time.strftime("%H:%M:%S", time.localtime(now))
+    tracker.close()
+
+
+def test_cost_report_matches_stdlib_json(tmp_path, monkeypatch):
+    report = {"task_name": "task", "parameters": {"nested": [1, 2.5, None]}, "cost_usd": 0.1234}
+    fast_path = tmp_path / "fast.json"
+    slow_path = tmp_path / "slow.json"
+
+    _write_json_report(fast_path, report)
+    monkeypatch.setattr("src.utils.cost_tracker.orjson", None)
+    _write_json_report(slow_path, report)
+
+    assert json.loads(fast_path.read_text()) == json.loads(slow_path.read_text()) == report
+
+
+def test_phase_and_total_cost_accumulate_per_call(tmp_path):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    tracker.start_phase("phase1")
+    tracker.record_api_call("phase1", 400_000, 100_000)
+    tracker.record_api_call("phase1", 600_000, 50_000)
+    tracker.record_api_call("untracked", 1_000_000, 0)
+    tracker.end_phase("phase1")
+
+    phase_cost = tracker._calculate_cost(1_000_000, 150_000)
+    assert tracker.phases["phase1"]["cost"] == pytest.approx(phase_cost)
+    assert tracker.total_cost == pytest.approx(phase_cost + tracker._calculate_cost(1_000_000, 0))
+    tracker.close()
+
+
+def test_report_times_use_start_time(tmp_path):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    tracker.finalize()
+
+    started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(tracker.start_time))
+    report = json.loads(tracker.cost_file.read_text())
+    assert f"Started: {started}\n" in tracker.log_file.read_text()
+    assert report["start_time"] == started.replace(" ", "T")
+    assert tracker.log_file.name == (
+        f"task_{time.strftime('%Y%m%d_%H%M%S', time.localtime(tracker.start_time))}.log"
+    )
+
+
+def test_mock_tracker_accepts_every_tracker_method(capsys):
+    tracker = MockCostTracker("task", "gemini-2.5-pro")
+
+    tracker.set_parameters({"a": 1})
+    tracker.start_phase("phase1")
+    tracker.record_api_call("phase1", 10, 5, prompt_preview="hi")
+    tracker.end_phase("phase1")
+    tracker.close()
+    tracker.finalize()
+
+    assert "[DRY RUN MODE] No costs to track" in capsys.readouterr().out
+
+
+def test_mock_tracker_rejects_unknown_methods():
+    tracker = MockCostTracker("task", "gemini-2.5-pro")
+
+    with pytest.raises(AttributeError):
+        tracker.record_api_cal("phase1", 10, 5)
+    with pytest.raises(AttributeError):
+        tracker._write_log("line")
+
+
+def test_prompt_preview_can_be_disabled(tmp_path):
+    shown = CostTracker("shown", "gemini-2.5-pro", log_dir=str(tmp_path))
+    hidden = CostTracker("hidden", "gemini-2.5-pro", log_dir=str(tmp_path), log_previews=False)
+    for tracker in (shown, hidden):
+        tracker.record_api_call("phase1", 10, 5, prompt_preview="a\r\nb")
+        tracker.close()
+
+    assert "  Prompt: a  b...\n" in shown.log_file.read_text()
+    assert "Prompt:" not in hidden.log_file.read_text()
+
+
+def test_summary_lists_only_ended_phases(tmp_path):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    tracker.start_phase("done")
+    tracker.start_phase("open")
+    assert list(tracker.phases["done"]) == list(tracker.phases["open"])
+    tracker.end_phase("done")
+    tracker.finalize()
+
+    summary = tracker.log_file.read_text().split("PHASE BREAKDOWN:")[1]
+    assert "  done:\n" in summary
+    assert "  open:\n" not in summary
+    assert json.loads(tracker.cost_file.read_text())["phases"]["open"]["duration"] is None
+
+
+def test_unclosed_tracker_stops_writer_when_collected(tmp_path):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    tracker.record_event("before drop")
+    writer = tracker._writer
+    assert writer.is_alive()
+
+    del tracker
+    gc.collect()
+
+    assert not writer.is_alive()
+    assert writer.path.read_text().endswith("before drop\n")
+
+
+def test_events_after_finalize_are_still_logged(tmp_path, capsys):
+    tracker = CostTracker("task", "gemini-2.5-pro", log_dir=str(tmp_path))
+    assert not tracker._writer.is_alive()
+
+    tracker.finalize()
+    tracker.record_event("late event")
+
+    assert tracker.log_file.read_text().endswith("late event\n")
@@ -0,0 +1,422 @@
+"""
+Tests for BaseLLMProvider invocation helpers.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from src.utils.llm.base import (
+    PROVIDER_FACTORIES,
+    BaseLLMProvider,
+    Message,
+    RetryConfig,
+    clear_provider_cache,
+    create_provider,
+    warm_providers,
+)
+from src.utils.llm.cache import MemoryBackend, SemanticLLMCache
+from src.utils.llm.config import Provider
+from src.utils.llm.structured import create_json_prompt_suffix
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class _FakeStructuredModel:
+    def __init__(self, model, output_class):
+        self.model = model
+        self.output_class = output_class
+
+    def invoke(self, messages, **kwargs):
+        raw = self.model.invoke(messages, **kwargs)
+        return {
+            "raw": raw,
+            "parsed": self.output_class.model_validate_json(raw.content),
+            "parsing_error": None,
+        }
+
+
+class _FakeChatModel:
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.stream_failures = 0
+        self.ainvoke_failures = {}
+
+    def invoke(self, messages, **kwargs):
+        self.calls += 1
+        return AIMessage(
+            content=self.content,
+            usage_metadata={"input_tokens": 12, "output_tokens": 3, "total_tokens": 15},
+        )
+
+    def batch(self, message_batches, config=None, **kwargs):
+        self.batch_config = config
+        return [self.invoke(messages, **kwargs) for messages in message_batches]
+
+    async def ainvoke(self, messages, **kwargs):
+        content = messages[-1].content
+        if self.ainvoke_failures.get(content):
+            self.ainvoke_failures[content] -= 1
+            raise TimeoutError("request timed out")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return AIMessage(
+            content=content,
+            usage_metadata={"input_tokens": 12, "output_tokens": 3, "total_tokens": 15},
+        )
+
+    async def astream(self, messages, **kwargs):
+        if self.stream_failures:
+            self.stream_failures -= 1
+            raise ConnectionError("connection reset")
+        for word in self.content.split():
+            yield AIMessageChunk(content=word + " ")
+        yield AIMessageChunk(
+            content="",
+            usage_metadata={"input_tokens": 12, "output_tokens": 3, "total_tokens": 15},
+            response_metadata={"finish_reason": "STOP"},
+        )
+
+    def with_structured_output(self, output_class, method=None, include_raw=False):
+        assert include_raw
+        return _FakeStructuredModel(self, output_class)
+
+
+class _FakeProvider(BaseLLMProvider):
+    def _create_model(self, **kwargs) -> Any:
+        return _FakeChatModel(kwargs.get("content", '{"value": 7}'))
+
+    def _extract_token_usage(self, response: Any) -> tuple:
+        usage = response.usage_metadata
+        return usage["input_tokens"], usage["output_tokens"]
+
+
+def test_invoke_structured_calls_model_once():
+    provider = _FakeProvider("gemini-2.5-pro")
+
+    parsed, response = provider.invoke_structured(
+        [Message(role="human", content="What is the value?")],
+        Answer,
+    )
+
+    assert parsed == Answer(value=7)
+    assert provider._model.calls == 1
+    assert (response.input_tokens, response.output_tokens) == (12, 3)
+    assert response.content == '{"value": 7}'
+
+
+def test_invoke_structured_estimates_usage_without_raw_response(monkeypatch):
+    from src.utils.llm.structured import StructuredOutputHandler
+
+    monkeypatch.setattr(
+        StructuredOutputHandler,
+        "invoke_with_raw",
+        lambda self, messages, **kwargs: (Answer(value=7), None),
+    )
+    provider = _FakeProvider("gemini-2.5-pro")
+
+    parsed, response = provider.invoke_structured(
+        [Message(role="human", content="What is the value?")],
+        Answer,
+    )
+
+    assert parsed == Answer(value=7)
+    assert response.usage_estimated
+    assert response.input_tokens == len("What is the value?") // 4
+    assert response.output_tokens == len('{"value":7}') // 4
+
+
+def test_invoke_structured_does_not_retry_failed_fallback():
+    provider = _FakeProvider("gemini-2.5-pro", content="no json here")
+
+    with pytest.raises(ValueError):
+        provider.invoke_structured([Message(role="human", content="Value?")], Answer)
+
+    # One native structured attempt plus the handler's JSON-prompt fallback
+    assert provider._model.calls == 2
+
+
+def test_convert_messages_handles_each_message_type():
+    provider = _FakeProvider("gemini-2.5-pro")
+    passthrough = AIMessage(content="earlier reply")
+
+    converted = provider._convert_messages([
+        Message(role="system", content="be brief"),
+        {"role": "user", "content": "hi"},
+        passthrough,
+    ])
+
+    assert [type(msg) for msg in converted] == [SystemMessage, HumanMessage, AIMessage]
+    assert [msg.content for msg in converted] == ["be brief", "hi", "earlier reply"]
+    assert converted[2] is passthrough
+    with pytest.raises(TypeError):
+        provider._convert_messages(["plain string"])
+
+
+def test_message_to_langchain_maps_roles():
+    assert type(Message(role="user", content="x").to_langchain()) is HumanMessage
+    assert type(Message(role="ai", content="x").to_langchain()) is AIMessage
+    with pytest.raises(ValueError):
+        Message(role="narrator", content="x").to_langchain()
+
+
+def test_batch_wraps_each_response_with_token_usage():
+    provider = _FakeProvider("gemini-2.5-pro", content="ok")
+
+    responses = provider.batch([
+        [Message(role="human", content="one")],
+        [{"role": "user", "content": "two"}],
+    ])
+
+    assert [r.content for r in responses] == ["ok", "ok"]
+    assert [(r.input_tokens, r.output_tokens) for r in responses] == [(12, 3), (12, 3)]
+    assert provider._model.batch_config == {"max_concurrency": 32}
+    assert all(r.model == "gemini-2.5-pro" for r in responses)
+
+
+def test_abatch_limits_concurrency_and_keeps_order():
+    provider = _FakeProvider("gemini-2.5-pro")
+    batches = [[Message(role="human", content=str(n))] for n in range(10)]
+
+    responses = asyncio.run(provider.abatch(batches, concurrency=3))
+
+    assert [r.content for r in responses] == [str(n) for n in range(10)]
+    assert provider._model.max_in_flight == 3
+
+
+def test_abatch_retries_each_request_independently():
+    provider = _FakeProvider("gemini-2.5-pro", retry_config=RetryConfig(initial_delay=0.0))
+    provider._model.ainvoke_failures = {"0": 2}
+    batches = [[Message(role="human", content=str(n))] for n in range(3)]
+
+    responses = asyncio.run(provider.abatch(batches))
+
+    assert [r.content for r in responses] == ["0", "1", "2"]
+    assert [r.retry_count for r in responses] == [2, 0, 0]
+
+
+def test_batch_works_inside_running_event_loop():
+    provider = _FakeProvider("gemini-2.5-pro", content="ok")
+
+    async def run():
+        return provider.batch([[Message(role="human", content="one")]])
+
+    assert [r.content for r in asyncio.run(run())] == ["ok"]
+    assert provider._model.calls == 1
+
+
+def test_batch_merges_caller_config():
+    provider = _FakeProvider("gemini-2.5-pro", content="ok")
+    batches = [[Message(role="human", content="one")]]
+
+    provider.batch(batches, config={"tags": ["eval"]})
+    assert provider._model.batch_config == {"tags": ["eval"], "max_concurrency": 32}
+
+    provider.batch(batches, concurrency=4, config={"max_concurrency": 2})
+    assert provider._model.batch_config == {"max_concurrency": 2}
+
+
+def _collect(stream):
+    async def run():
+        return [item async for item in stream]
+    return asyncio.run(run())
+
+
+def test_astream_yields_chunks_then_full_response():
+    provider = _FakeProvider("gemini-2.5-pro", content="streamed reply here")
+
+    *chunks, final = _collect(provider.astream([Message(role="human", content="hi")]))
+
+    assert chunks == ["streamed ", "reply ", "here ", ""]
+    assert final.content == "streamed reply here "
+    assert (final.input_tokens, final.output_tokens) == (12, 3)
+    assert (final.finish_reason, final.retry_count) == ("STOP", 0)
+
+
+def test_astream_retries_failures_before_first_chunk():
+    provider = _FakeProvider(
+        "gemini-2.5-pro",
+        content="ok",
+        retry_config=RetryConfig(initial_delay=0.0),
+    )
+    provider._model.stream_failures = 1
+
+    *chunks, final = _collect(provider.astream([Message(role="human", content="hi")]))
+
+    assert chunks == ["ok ", ""]
+    assert final.retry_count == 1
+
+
+def test_json_prompt_suffix_cached_per_class():
+    suffix = create_json_prompt_suffix(Answer)
+
+    assert create_json_prompt_suffix(Answer) is suffix
+    assert '"value"' in suffix
+
+
+def test_create_provider_caches_only_when_requested(monkeypatch):
+    from src.utils.llm.providers.gemini import GeminiProvider
+
+    monkeypatch.setattr(GeminiProvider, "_create_model", lambda self, **kwargs: object())
+    clear_provider_cache()
+
+    first = create_provider("gemini-2.5-pro", timeout=30, use_cache=True)
+    assert create_provider("gemini-2.5-pro", timeout=30, use_cache=True) is first
+    assert create_provider(
+        "gemini-2.5-pro", temperature=0.5, timeout=30, use_cache=True
+    ) is not first
+    assert create_provider("gemini-2.5-pro", timeout=30) is not first
+    assert create_provider(
+        "gemini-2.5-pro", retry_config=RetryConfig(), use_cache=True
+    ) is not create_provider("gemini-2.5-pro", retry_config=RetryConfig(), use_cache=True)
+
+    clear_provider_cache()
+    assert create_provider("gemini-2.5-pro", timeout=30, use_cache=True) is not first
+    clear_provider_cache()
+
+
+def test_warm_providers_registers_provider_classes():
+    from src.utils.llm.providers.anthropic import AnthropicProvider
+
+    for thread in warm_providers([Provider.ANTHROPIC]):
+        thread.join(timeout=10)
+
+    assert PROVIDER_FACTORIES[Provider.ANTHROPIC] is AnthropicProvider
+
+
+def test_invoke_serves_repeat_deterministic_calls_from_cache():
+    provider = _FakeProvider("gemini-2.5-pro", cache=MemoryBackend())
+    messages = [Message(role="human", content="What is the value?")]
+
+    first = provider.invoke(messages)
+    second = provider.invoke(messages)
+    parsed, structured = provider.invoke_structured(messages, Answer)
+    parsed_again, structured_again = provider.invoke_structured(messages, Answer)
+
+    assert provider._model.calls == 2
+    assert (first.cache_hit, second.cache_hit) == (False, True)
+    assert second.content == first.content
+    assert (second.input_tokens, second.output_tokens) == (0, 0)
+    assert parsed_again == parsed and parsed_again is not parsed
+    assert structured_again.cache_hit and not structured.cache_hit
+    assert provider.stats == {"hits": 2, "misses": 2, "semantic_hits": 0}
+
+
+def test_invoke_skips_cache_when_sampling():
+    provider = _FakeProvider("gemini-2.5-pro", temperature=0.7, cache=MemoryBackend())
+    messages = [Message(role="human", content="What is the value?")]
+
+    provider.invoke(messages)
+    provider.invoke(messages)
+
+    assert provider._model.calls == 2
+    assert provider.stats == {"hits": 0, "misses": 0, "semantic_hits": 0}
+
+
+def test_invoke_reuses_semantically_similar_answer():
+    semantic_cache = SemanticLLMCache(lambda text: [text.lower().count("value"), 1.0])
+    provider = _FakeProvider("gemini-2.5-pro", semantic_cache=semantic_cache)
+
+    provider.invoke([Message(role="human", content="What is the value?")])
+    response = provider.invoke([Message(role="human", content="what is the VALUE")])
+
+    assert provider._model.calls == 1
+    assert response.cache_hit
+    assert provider.stats["semantic_hits"] == 1
+
+
+def test_invoke_skips_semantic_cache_when_sampling():
+    semantic_cache = SemanticLLMCache(lambda text: [text.lower().count("value"), 1.0])
+    provider = _FakeProvider(
+        "gemini-2.5-pro", temperature=0.7, semantic_cache=semantic_cache
+    )
+
+    provider.invoke([Message(role="human", content="What is the value?")])
+    provider.invoke([Message(role="human", content="what is the VALUE")])
+
+    assert provider._model.calls == 2
+    assert len(semantic_cache) == 0
+
+
+class _RateLimited(Exception):
+    def __init__(self, headers):
+        super().__init__("429 too many requests")
+        self.response = type("Response", (), {"headers": headers})()
+
+
+def test_calculate_delay_uses_decorrelated_jitter():
+    provider = _FakeProvider(
+        "gemini-2.5-pro",
+        retry_config=RetryConfig(initial_delay=1.0, max_delay=10.0),
+    )
+
+    delay = None
+    for attempt in range(20):
+        previous = 1.0 if delay is None else delay
+        delay = provider._calculate_delay(attempt, prev_delay=delay)
+        assert 1.0 <= delay <= min(10.0, previous * 3)
+
+
+def test_retry_config_precomputes_backoff_schedule():
+    config = RetryConfig(max_retries=5, initial_delay=1.0, max_delay=10.0)
+    provider = _FakeProvider("gemini-2.5-pro", retry_config=config)
+
+    assert config.delays == (1.0, 2.0, 4.0, 8.0, 10.0, 10.0)
+    assert 1.0 <= provider._calculate_delay(0) <= 2.0
+    assert provider._calculate_delay(2, prev_delay=1.0) <= 3.0
+
+
+def test_calculate_delay_honors_retry_after():
+    provider = _FakeProvider("gemini-2.5-pro", retry_config=RetryConfig(max_delay=60.0))
+
+    assert provider._calculate_delay(0, error=_RateLimited({"retry-after": "7"})) == 7.0
+    assert provider._calculate_delay(0, error=_RateLimited({"retry-after": "900"})) == 60.0
+    assert 1.0 <= provider._calculate_delay(0, error=_RateLimited({"retry-after": "soon"})) <= 3.0
+
+
+def test_retryable_errors_dispatch_on_exception_class():
+    provider = _FakeProvider("gemini-2.5-pro")
+    no_timeouts = _FakeProvider("gemini-2.5-pro", retry_config=RetryConfig(retry_on_timeout=False))
+
+    assert provider._is_retryable_error(TimeoutError())
+    assert provider._is_retryable_error(ConnectionResetError())
+    assert provider._is_retryable_error(RuntimeError("wrapped: 429 Too Many Requests"))
+    assert provider._is_retryable_error(Exception("429 RESOURCE_EXHAUSTED"))
+    assert not provider._is_retryable_error(ValueError("invalid argument"))
+    assert not no_timeouts._is_retryable_error(TimeoutError())
+    assert no_timeouts._is_retryable_error(ConnectionError())
+
+
+def test_retryable_errors_use_sdk_status_codes():
+    class _StatusError(Exception):
+        def __init__(self, code):
+            super().__init__("request failed")
+            self.code = code
+
+    provider = _FakeProvider("gemini-2.5-pro")
+    no_rate_limits = _FakeProvider(
+        "gemini-2.5-pro", retry_config=RetryConfig(retry_on_rate_limit=False)
+    )
+
+    assert provider._is_retryable_error(_StatusError(429))
+    assert provider._is_retryable_error(_StatusError(503))
+    assert not provider._is_retryable_error(_StatusError(400))
+    assert not no_rate_limits._is_retryable_error(_StatusError(429))
+
+
+def test_response_types_use_slots():
+    response = _FakeProvider("gemini-2.5-pro").invoke([Message(role="human", content="hi")])
+
+    assert not hasattr(response, "__dict__")
+    assert not hasattr(Message(role="human", content="hi"), "__dict__")
+    assert "raw_response" not in repr(response)
@@ -0,0 +1,124 @@
+"""
+Tests for the exact-match LLM response cache.
+"""
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.utils.llm.cache import MemoryBackend, SemanticLLMCache, make_cache_key
+
+
+def test_memory_backend_evicts_least_recently_used():
+    cache = MemoryBackend(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_memory_backend_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.utils.llm.cache.time.monotonic", lambda: now[0])
+    cache = MemoryBackend(ttl=10)
+    cache.set("a", 1)
+
+    now[0] = 109.0
+    assert cache.get("a") == 1
+    now[0] = 111.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_key_depends_on_every_request_part():
+    messages = [SystemMessage(content="sys"), HumanMessage(content="hi")]
+    key = make_cache_key("gemini-2.5-pro", 100, messages)
+
+    assert make_cache_key("gemini-2.5-pro", 100, list(messages)) == key
+    assert make_cache_key("gemini-2.0-flash", 100, messages) != key
+    assert make_cache_key("gemini-2.5-pro", 200, messages) != key
+    assert make_cache_key("gemini-2.5-pro", 100, messages[1:]) != key
+    assert make_cache_key("gemini-2.5-pro", 100, messages, {"stop": ["x"]}) != key
+
+
+def _embed(text):
+    # Bag of known words; paraphrases that share words embed close together
+    vocabulary = ["capital", "france", "paris", "weather", "today", "what", "is", "the"]
+    words = text.lower().replace("?", "").split()
+    return [float(words.count(word)) for word in vocabulary]
+
+
+def test_semantic_cache_matches_paraphrases_within_context():
+    cache = SemanticLLMCache(_embed, threshold=0.9)
+    system = SystemMessage(content="sys")
+    question = HumanMessage(content="What is the capital of France?")
+    paraphrase = HumanMessage(content="what is the capital of france")
+    cache.store("m", 10, [system, question], "Paris")
+
+    assert cache.lookup("m", 10, [system, paraphrase]) == "Paris"
+    assert cache.lookup("m", 10, [system, HumanMessage(content="weather today")]) is None
+    assert cache.lookup("m", 10, [question]) is None
+    assert cache.lookup("other", 10, [system, question]) is None
+
+
+def test_semantic_cache_evicts_oldest_entries():
+    cache = SemanticLLMCache(_embed, maxsize=1)
+    cache.store("m", 10, [HumanMessage(content="capital of france")], "Paris")
+    cache.store("m", 10, [HumanMessage(content="weather today")], "Sunny")
+
+    assert len(cache) == 1
+    assert cache.lookup("m", 10, [HumanMessage(content="capital of france")]) is None
+    assert cache.lookup("m", 10, [HumanMessage(content="weather today")]) == "Sunny"
+
+
+def test_semantic_cache_evicts_expired_entries_on_store(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.utils.llm.cache.time.monotonic", lambda: now[0])
+    cache = SemanticLLMCache(_embed, ttl=10)
+    cache.store("m", 10, [HumanMessage(content="capital of france")], "Paris")
+    now[0] = 105.0
+    cache.store("m", 10, [HumanMessage(content="weather today")], "Sunny")
+
+    now[0] = 111.0
+    cache.store("m", 10, [HumanMessage(content="what is the")], "Unknown")
+
+    assert len(cache) == 2
+    assert cache.lookup("m", 10, [HumanMessage(content="capital of france")]) is None
+    assert cache.lookup("m", 10, [HumanMessage(content="weather today")]) == "Sunny"
+    assert cache.lookup("m", 10, [HumanMessage(content="what is the")]) == "Unknown"
+
+
+def test_semantic_cache_embeds_each_prompt_once_per_miss():
+    calls = []
+    cache = SemanticLLMCache(lambda text: calls.append(text) or _embed(text))
+    messages = [HumanMessage(content="capital of france")]
+
+    assert cache.lookup("m", 10, messages) is None
+    cache.store("m", 10, messages, "Paris")
+
+    assert calls == ["capital of france"]
+
+
+def test_semantic_cache_keeps_vectors_aligned_through_growth_and_eviction():
+    words = ["capital", "france", "paris", "weather", "today", "what", "is", "the"]
+    cache = SemanticLLMCache(_embed, maxsize=3)
+    for word in words:
+        cache.store("m", 10, [HumanMessage(content=word)], word)
+
+    assert len(cache) == 3
+    for word in words[-3:]:
+        assert cache.lookup("m", 10, [HumanMessage(content=word)]) == word
+    assert cache.lookup("m", 10, [HumanMessage(content=words[0])]) is None
+
+
+def test_semantic_cache_grows_matrix_past_initial_capacity():
+    cache = SemanticLLMCache(lambda text: [float(text == str(n)) for n in range(40)])
+    for n in range(40):
+        cache.store("m", 10, [HumanMessage(content=str(n))], n)
+
+    assert [cache.lookup("m", 10, [HumanMessage(content=str(n))]) for n in range(40)] == list(
+        range(40)
+    )
@@ -0,0 +1,21 @@
+"""
+Tests for the LLM model registry.
+"""
+
+import pytest
+
+from src.utils.llm.config import MODEL_REGISTRY, get_model_config
+
+
+def test_get_model_config_returns_registered_config():
+    assert get_model_config("gemini-2.5-pro") is MODEL_REGISTRY["gemini-2.5-pro"]
+
+
+def test_get_model_config_lists_available_models_on_miss():
+    with pytest.raises(ValueError, match="Unknown model: gpt-2.*gemini-2.5-pro"):
+        get_model_config("gpt-2")
+
+
+def test_model_registry_is_read_only():
+    with pytest.raises(TypeError):
+        MODEL_REGISTRY["gpt-2"] = MODEL_REGISTRY["gpt-4o"]
@@ -0,0 +1,32 @@
+"""
+Tests for the shared provider HTTP client.
+"""
+
+from src.utils.llm import base
+from src.utils.llm.http_clients import close_clients, get_sync_client
+
+
+def test_sync_client_shared_until_closed():
+    client = get_sync_client()
+
+    assert get_sync_client() is client
+    assert client.timeout.read == 120.0
+
+    close_clients()
+    assert client.is_closed
+    replacement = get_sync_client()
+    assert replacement is not client
+    close_clients()
+
+
+def test_close_clients_drops_cached_providers(monkeypatch):
+    from src.utils.llm.providers.gemini import GeminiProvider
+
+    monkeypatch.setattr(GeminiProvider, "_create_model", lambda self, **kwargs: object())
+    provider = base.create_provider("gemini-2.5-pro", use_cache=True)
+
+    close_clients()
+
+    assert not base._PROVIDER_CACHE
+    assert base.create_provider("gemini-2.5-pro", use_cache=True) is not provider
+    base.clear_provider_cache()
@@ -0,0 +1,113 @@
+"""
+Tests for provider-specific message handling and token accounting.
+"""
+
+import sys
+import types
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.utils.llm import base
+from src.utils.llm.base import Message, RetryConfig
+from src.utils.llm.providers.anthropic import AnthropicProvider
+from src.utils.llm.providers.gemini import GeminiProvider
+
+
+def _make_anthropic(monkeypatch) -> AnthropicProvider:
+    monkeypatch.setattr(AnthropicProvider, "_create_model", lambda self, **kwargs: object())
+    return AnthropicProvider("claude-3-5-haiku")
+
+
+def test_anthropic_marks_last_system_prompt_cacheable(monkeypatch):
+    provider = _make_anthropic(monkeypatch)
+
+    converted = provider._convert_messages([
+        Message(role="system", content="first"),
+        Message(role="system", content="long static instructions"),
+        Message(role="human", content="question"),
+    ])
+
+    assert converted[0].content == "first"
+    assert converted[1].content == [{
+        "type": "text",
+        "text": "long static instructions",
+        "cache_control": {"type": "ephemeral"},
+    }]
+    assert isinstance(converted[1], SystemMessage)
+    assert isinstance(converted[2], HumanMessage)
+
+
+def test_anthropic_reports_prompt_cache_tokens(monkeypatch):
+    provider = _make_anthropic(monkeypatch)
+    response = AIMessage(
+        content="answer",
+        response_metadata={"usage": {
+            "input_tokens": 50,
+            "output_tokens": 7,
+            "cache_read_input_tokens": 1200,
+            "cache_creation_input_tokens": 30,
+        }},
+    )
+
+    result = provider._to_llm_response(response)
+
+    assert (result.input_tokens, result.output_tokens) == (50, 7)
+    assert (result.cached_input_tokens, result.cache_creation_tokens) == (1200, 30)
+
+
+def _fake_anthropic_sdk() -> types.ModuleType:
+    # Mirrors the real SDK hierarchy, where timeouts are connection errors
+    sdk = types.ModuleType("anthropic")
+    sdk.APIError = type("APIError", (Exception,), {})
+    sdk.APIConnectionError = type("APIConnectionError", (sdk.APIError,), {})
+    sdk.APITimeoutError = type("APITimeoutError", (sdk.APIConnectionError,), {})
+    sdk.APIStatusError = type("APIStatusError", (sdk.APIError,), {})
+    sdk.RateLimitError = type("RateLimitError", (sdk.APIStatusError,), {})
+    sdk.InternalServerError = type("InternalServerError", (sdk.APIStatusError,), {})
+    return sdk
+
+
+def test_anthropic_retries_sdk_rate_limit_errors(monkeypatch):
+    sdk = _fake_anthropic_sdk()
+    monkeypatch.setitem(sys.modules, "anthropic", sdk)
+    monkeypatch.setattr(base, "_RETRYABLE_EXC_CACHE", {})
+    provider = _make_anthropic(monkeypatch)
+
+    assert provider._is_retryable_error(sdk.RateLimitError("slow down"))
+    assert provider._is_retryable_error(sdk.InternalServerError("overloaded"))
+    assert provider._is_retryable_error(sdk.APIConnectionError("connection reset"))
+    assert provider._is_retryable_error(sdk.APITimeoutError("Request timed out."))
+    assert not provider._is_retryable_error(ValueError("invalid request"))
+    # With SDK classes declared, unmatched errors are not scanned by message
+    assert not provider._is_retryable_error(ValueError("connection reset"))
+
+
+def test_anthropic_sdk_timeouts_respect_retry_on_timeout(monkeypatch):
+    sdk = _fake_anthropic_sdk()
+    monkeypatch.setitem(sys.modules, "anthropic", sdk)
+    monkeypatch.setattr(base, "_RETRYABLE_EXC_CACHE", {})
+    provider = _make_anthropic(monkeypatch)
+    provider.retry_config = RetryConfig(retry_on_timeout=False)
+
+    assert not provider._is_retryable_error(sdk.APITimeoutError("Request timed out."))
+    assert provider._is_retryable_error(sdk.APIConnectionError("connection reset"))
+
+
+def test_gemini_caches_token_usage_reader_per_response_type(monkeypatch):
+    monkeypatch.setattr(GeminiProvider, "_create_model", lambda self, **kwargs: object())
+    provider = GeminiProvider("gemini-2.5-pro")
+    usage = {"input_tokens": 40, "output_tokens": 9, "total_tokens": 49}
+
+    assert provider._extract_token_usage(AIMessage(content="a", usage_metadata=usage)) == (40, 9)
+    assert AIMessage in provider._extract_fn_cache
+
+    # Same type, different shape: the cached reader misses and the probe runs again
+    legacy = AIMessage(
+        content="b",
+        response_metadata={"usage_metadata": {
+            "prompt_token_count": 21,
+            "candidates_token_count": 4,
+        }},
+    )
+    assert provider._extract_token_usage(legacy) == (21, 4)
+    assert provider._extract_token_usage(AIMessage(content="12345678")) == (0, 2)